@@ -1,6 +1,12 @@
 from her.agents.conversation import ConversationAgent
-from her.agents.orchestrator import AgentOrchestrator
+from her.agents.orchestrator import AgentOrchestrator, OrchestratorBusyError
 from her.agents.planner import PlannerAgent
 from her.agents.reflection import ReflectionAgent
 
-__all__ = ["ConversationAgent", "AgentOrchestrator", "PlannerAgent", "ReflectionAgent"]
+__all__ = [
+    "ConversationAgent",
+    "AgentOrchestrator",
+    "OrchestratorBusyError",
+    "PlannerAgent",
+    "ReflectionAgent",
+]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import asyncio
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from her.agents.preprocessing import ProcessedInput, preprocess_input, processed_summary
 from her.agents.token_budget import TokenBudgetManager
 from her.embeddings.service import EmbeddingService
 from her.guardrails.ethical_core import EthicalCore
+from her.memory.snapshots import ActiveGoalSnapshot
 from her.memory.store import MemoryStore
 from her.memory.types import GoalRecord, SemanticMemoryRecord
 from her.memory.working import WorkingMemory
@@ -31,6 +33,7 @@ class ConversationAgent:
         semantic_top_k: int = 5,
         recent_episode_limit: int = 8,
         active_goal_limit: int = 5,
+        goal_snapshot: Optional[ActiveGoalSnapshot] = None,
     ) -> None:
         self._router = router
         self._ethical_core = ethical_core
@@ -42,6 +45,7 @@ class ConversationAgent:
         self._semantic_top_k = semantic_top_k
         self._recent_episode_limit = recent_episode_limit
         self._active_goal_limit = active_goal_limit
+        self._goal_snapshot = goal_snapshot
         self._logger = get_logger("conversation_agent")
 
     async def respond(self, session_id: UUID, content: str, trace_id: str) -> LLMResponse:
@@ -58,10 +62,11 @@ class ConversationAgent:
             },
         )
 
-        embedding = await self._embeddings.embed(processed.sanitized_text)
-        semantic_records = await self._retrieve_semantic(embedding)
-        recent_episodes = await self._retrieve_recent_episodes(session_id)
-        active_goals = await self._retrieve_active_goals()
+        (embedding, semantic_records), recent_episodes, active_goals = await asyncio.gather(
+            self._embed_and_retrieve_semantic(processed.sanitized_text),
+            self._retrieve_recent_episodes(session_id),
+            self._retrieve_active_goals(),
+        )
 
         episode = await self._persist_episode(session_id, processed, embedding)
         await self._emit_event(
@@ -72,8 +77,9 @@ class ConversationAgent:
             },
         )
 
-        await self._working.append(session_id=session_id, role="user", content=processed.sanitized_text)
-        history = await self._working.get(session_id)
+        history = await self._working.append_and_get(
+            session_id=session_id, role="user", content=processed.sanitized_text
+        )
 
         base_system_prompt = await self._personality.build_prompt_for_interaction(processed.sanitized_text)
         context_sections = _build_context_sections(processed, semantic_records, recent_episodes, active_goals)
@@ -103,24 +109,26 @@ class ConversationAgent:
         response = await self._router.generate(request)
         self._ethical_core.validate_model_content(response.content)
 
-        await self._working.append(session_id=session_id, role="assistant", content=response.content)
-        await self._memory_store.record_llm_usage(
-            provider=response.provider,
-            model=response.model,
-            prompt_tokens=response.prompt_tokens,
-            completion_tokens=response.completion_tokens,
-            cost_usd=response.cost_usd,
-            latency_ms=response.latency_ms,
-            episode_id=episode.id,
-        )
-
-        await self._emit_event(
-            "response.generated",
-            {
-                "session_id": str(session_id),
-                "provider": response.provider,
-                "cost_usd": f"{response.cost_usd:.6f}",
-            },
+        # The post-response writes are independent, so issue them together.
+        await asyncio.gather(
+            self._working.append(session_id=session_id, role="assistant", content=response.content),
+            self._memory_store.record_llm_usage(
+                provider=response.provider,
+                model=response.model,
+                prompt_tokens=response.prompt_tokens,
+                completion_tokens=response.completion_tokens,
+                cost_usd=response.cost_usd,
+                latency_ms=response.latency_ms,
+                episode_id=episode.id,
+            ),
+            self._emit_event(
+                "response.generated",
+                {
+                    "session_id": str(session_id),
+                    "provider": response.provider,
+                    "cost_usd": f"{response.cost_usd:.6f}",
+                },
+            ),
         )
         return response
 
@@ -138,6 +146,12 @@ class ConversationAgent:
             metadata=metadata,
         )
 
+    async def _embed_and_retrieve_semantic(
+        self, text: str
+    ) -> Tuple[List[float] | None, List[SemanticMemoryRecord]]:
+        embedding = await self._embeddings.embed(text)
+        return embedding, await self._retrieve_semantic(embedding)
+
     async def _retrieve_semantic(self, embedding: List[float] | None) -> List[SemanticMemoryRecord]:
         if embedding is None:
             return []
@@ -162,6 +176,9 @@ class ConversationAgent:
             return []
 
     async def _retrieve_active_goals(self) -> List[GoalRecord]:
+        if self._goal_snapshot is not None:
+            goals = await self._goal_snapshot.get()
+            return goals if len(goals) <= self._active_goal_limit else goals[: self._active_goal_limit]
         try:
             return await self._memory_store.list_active_goals(limit=self._active_goal_limit)
         except Exception as exc:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from enum import Enum
 from uuid import UUID
 
@@ -13,18 +14,29 @@ class OrchestratorState(str, Enum):
     completed = "completed"
 
 
+class OrchestratorBusyError(Exception):
+    """Raised when the in-flight interaction limit is reached."""
+
+
 class AgentOrchestrator:
     """State-machine style coordinator for interaction lifecycle."""
 
-    def __init__(self, conversation_agent: ConversationAgent) -> None:
+    def __init__(self, conversation_agent: ConversationAgent, max_inflight: int = 64) -> None:
         self._conversation = conversation_agent
+        self._slots = asyncio.Semaphore(max_inflight)
 
     async def handle_interaction(self, session_id: UUID, content: str, trace_id: str) -> LLMResponse:
         """Run a complete interaction through orchestrated states."""
 
+        if self._slots.locked():
+            raise OrchestratorBusyError("Too many interactions in flight")
+
         _state = OrchestratorState.received
-        _state = OrchestratorState.generating
-        response = await self._conversation.respond(session_id=session_id, content=content, trace_id=trace_id)
+        async with self._slots:
+            _state = OrchestratorState.generating
+            response = await self._conversation.respond(
+                session_id=session_id, content=content, trace_id=trace_id
+            )
         _state = OrchestratorState.completed
         _ = _state
         return response
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Dict, Optional
 from uuid import UUID, uuid4
 
+from her.memory.snapshots import ActiveGoalSnapshot
 from her.memory.store import MemoryStore
 from her.memory.types import GoalRecord
 
@@ -20,15 +21,22 @@ class Goal:
 class PlannerAgent:
     """Minimal goal planner and tracker."""
 
-    def __init__(self, memory_store: Optional[MemoryStore] = None) -> None:
+    def __init__(
+        self,
+        memory_store: Optional[MemoryStore] = None,
+        goal_snapshot: Optional[ActiveGoalSnapshot] = None,
+    ) -> None:
         self._goals: Dict[UUID, Goal] = {}
         self._memory_store = memory_store
+        self._goal_snapshot = goal_snapshot
 
     async def create_goal(self, description: str) -> Goal:
         """Create and store a new active goal."""
 
         if self._memory_store is not None:
             db_goal: GoalRecord = await self._memory_store.create_goal(description=description)
+            if self._goal_snapshot is not None:
+                self._goal_snapshot.mark_stale()
             return Goal(
                 id=db_goal.id,
                 description=db_goal.description,
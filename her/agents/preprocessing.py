@@ -10,6 +10,16 @@ Sentiment = Literal["positive", "neutral", "negative"]
 
 POSITIVE_WORDS = {"great", "thanks", "awesome", "love", "good", "perfect", "helpful"}
 NEGATIVE_WORDS = {"bad", "hate", "wrong", "angry", "upset", "frustrated", "annoyed"}
+TASK_WORDS = frozenset({"build", "create", "implement", "fix", "add"})
+
+_SENTIMENT_WEIGHTS: Dict[str, int] = {
+    **{word: 1 for word in POSITIVE_WORDS},
+    **{word: -1 for word in NEGATIVE_WORDS},
+}
+_WHITESPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9']+")
+_ENTITY_RE = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
+_EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+")
 
 
 @dataclass
@@ -49,25 +59,28 @@ async def preprocess_input(text: str) -> ProcessedInput:
 def sanitize_text(text: str) -> str:
     """Normalize whitespace and strip non-printable characters."""
 
-    without_control = "".join(char for char in text if char.isprintable() or char.isspace())
-    collapsed = re.sub(r"\s+", " ", without_control).strip()
-    return collapsed
+    # Collapsing whitespace first leaves only printable text in the common case,
+    # which str.isprintable confirms in C; fall back to filtering per character.
+    collapsed = _WHITESPACE_RE.sub(" ", text)
+    if not collapsed.isprintable():
+        without_control = "".join(char for char in text if char.isprintable() or char.isspace())
+        collapsed = _WHITESPACE_RE.sub(" ", without_control)
+    return collapsed.strip()
 
 
 def tokenize(text: str) -> List[str]:
     """Tokenize text into lowercase alphanumeric tokens."""
 
-    return re.findall(r"[a-zA-Z0-9']+", text.lower())
+    return _TOKEN_RE.findall(text.lower())
 
 
 def detect_sentiment(tokens: List[str]) -> Sentiment:
     """Estimate sentiment with a simple lexical heuristic."""
 
-    positive = sum(1 for token in tokens if token in POSITIVE_WORDS)
-    negative = sum(1 for token in tokens if token in NEGATIVE_WORDS)
-    if positive > negative:
+    score = sum(_SENTIMENT_WEIGHTS.get(token, 0) for token in tokens)
+    if score > 0:
         return "positive"
-    if negative > positive:
+    if score < 0:
         return "negative"
     return "neutral"
 
@@ -82,7 +95,7 @@ def classify_intent(text: str, tokens: List[str]) -> Intent:
         return "reflection"
     if "?" in text:
         return "question"
-    if any(token in {"build", "create", "implement", "fix", "add"} for token in tokens):
+    if not TASK_WORDS.isdisjoint(tokens):
         return "task"
     return "general"
 
@@ -90,10 +103,7 @@ def classify_intent(text: str, tokens: List[str]) -> Intent:
 def extract_entities(text: str) -> List[str]:
     """Extract coarse named entities from user input."""
 
-    entities = set(re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b", text))
-    emails = re.findall(r"[\w\.-]+@[\w\.-]+", text)
-    entities.update(emails)
-    return sorted(entities)
+    return sorted({*_ENTITY_RE.findall(text), *_EMAIL_RE.findall(text)})
 
 
 def detect_bias_signals(text: str) -> List[str]:
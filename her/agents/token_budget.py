@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Dict, List
+from itertools import islice
+from typing import Dict, List, Tuple
 from uuid import UUID
 
+_WORD_PATTERN = re.compile(r"\S+")
+
 
 @dataclass
 class ContextWindow:
@@ -30,20 +34,35 @@ class TokenBudgetManager:
     ) -> ContextWindow:
         """Assemble system prompt and chat messages within configured budget."""
 
-        system_prompt = self._compose_system_prompt(base_system_prompt, context_sections)
-        system_tokens = estimate_tokens(system_prompt)
+        system_prompt, system_words = self._compose_system_prompt(
+            base_system_prompt, context_sections
+        )
+        system_tokens = _tokens_for_words(system_words)
         budget_for_messages = max(100, self._max_input_tokens - system_tokens)
 
         kept_reversed: List[Dict[str, str]] = []
         used = 0
-        for message in reversed(messages):
+        if messages:
+            # The newest message is the one being answered, so it is always sent,
+            # cut down to the budget if it does not fit on its own.
+            latest = messages[-1]
+            latest_tokens = estimate_tokens(latest.get("content", "")) + 4
+            if latest_tokens > budget_for_messages:
+                content = _truncate_to_tokens(latest.get("content", ""), budget_for_messages - 4)
+                latest = {**latest, "content": content}
+                latest_tokens = estimate_tokens(content) + 4
+            kept_reversed.append(latest)
+            used = latest_tokens
+
+        # Keep the most recent contiguous run of older messages; older ones are not scanned.
+        for message in islice(reversed(messages), 1, None):
             message_tokens = estimate_tokens(message.get("content", "")) + 4
             if used + message_tokens > budget_for_messages:
-                continue
+                break
             kept_reversed.append(message)
             used += message_tokens
 
-        kept_messages = list(reversed(kept_reversed))
+        kept_messages = kept_reversed[::-1]
         dropped = max(0, len(messages) - len(kept_messages))
         self._session_totals[session_id] = self._session_totals.get(session_id, 0) + system_tokens + used
 
@@ -54,23 +73,44 @@ class TokenBudgetManager:
 
         return self._session_totals.get(session_id, 0)
 
-    def _compose_system_prompt(self, base_system_prompt: str, context_sections: List[str]) -> str:
+    def _compose_system_prompt(
+        self, base_system_prompt: str, context_sections: List[str]
+    ) -> Tuple[str, int]:
         sections = [base_system_prompt]
         for section in context_sections:
-            if section.strip():
-                sections.append(section.strip())
-
-        prompt = "\n\n".join(sections)
-        if estimate_tokens(prompt) <= self._max_input_tokens:
-            return prompt
-
-        while sections and estimate_tokens("\n\n".join(sections)) > self._max_input_tokens:
-            sections.pop()
-        return "\n\n".join(sections)
+            stripped = section.strip()
+            if stripped:
+                sections.append(stripped)
+
+        # Sections are joined with whitespace, so word counts add up across them
+        # and the kept total doubles as the prompt's word count.
+        kept = 0
+        words = 0
+        for section in sections:
+            section_words = len(section.split())
+            if _tokens_for_words(words + section_words) > self._max_input_tokens:
+                break
+            words += section_words
+            kept += 1
+        return "\n\n".join(sections[:kept]), words
 
 
 def estimate_tokens(text: str) -> int:
     """Approximate token count with conservative word-based heuristic."""
 
-    words = len(text.split())
+    return _tokens_for_words(len(text.split()))
+
+
+def _tokens_for_words(words: int) -> int:
     return max(1, int(words * 1.35))
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    # Cut after the last word that fits, keeping the original whitespace.
+    max_words = max(1, int(max_tokens / 1.35))
+    end = len(text)
+    for count, match in enumerate(_WORD_PATTERN.finditer(text), start=1):
+        if count == max_words:
+            end = match.end()
+            break
+    return text[:end]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import httpx
+import orjson
 
 from her.embeddings.base import EmbeddingProvider, normalize_dimensions
 from her.providers.errors import ProviderAuthError, ProviderServerError, ProviderTimeoutError
@@ -17,12 +18,14 @@ class CustomEmbeddingProvider(EmbeddingProvider):
         model: str,
         timeout_seconds: float,
         dimensions: int,
+        http_client: httpx.AsyncClient,
         api_key: str = "",
     ) -> None:
         self._endpoint = endpoint.strip()
         self._model = model
         self._timeout_seconds = timeout_seconds
         self._dimensions = dimensions
+        self._http_client = http_client
         self._api_key = api_key
 
     async def embed(self, text: str) -> list[float]:
@@ -35,8 +38,12 @@ class CustomEmbeddingProvider(EmbeddingProvider):
 
         payload = {"model": self._model, "input": text}
         try:
-            async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
-                response = await client.post(self._endpoint, json=payload, headers=headers)
+            response = await self._http_client.post(
+                self._endpoint,
+                content=orjson.dumps(payload),
+                headers=headers,
+                timeout=self._timeout_seconds,
+            )
         except httpx.TimeoutException as exc:
             raise ProviderTimeoutError("Custom embedding request timed out") from exc
 
@@ -46,7 +53,7 @@ class CustomEmbeddingProvider(EmbeddingProvider):
             raise ProviderServerError(f"Custom embedding server error: {response.status_code}")
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         vector = data.get("embedding")
         if vector is None:
             blocks = data.get("data", [])
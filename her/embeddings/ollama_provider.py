@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import httpx
+import orjson
 
 from her.embeddings.base import EmbeddingProvider, normalize_dimensions
 from her.providers.errors import ProviderServerError, ProviderTimeoutError
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OllamaEmbeddingProvider(EmbeddingProvider):
     """Ollama embedding provider with compatibility for old/new APIs."""
@@ -17,11 +20,13 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
         model: str,
         timeout_seconds: float,
         dimensions: int,
+        http_client: httpx.AsyncClient,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._model = model
         self._timeout_seconds = timeout_seconds
         self._dimensions = dimensions
+        self._http_client = http_client
 
     async def embed(self, text: str) -> list[float]:
         if not text.strip():
@@ -29,18 +34,27 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
 
         payload = {"model": self._model, "input": text}
         try:
-            async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
-                response = await client.post(f"{self._base_url}/api/embed", json=payload)
-                if response.status_code == 404:
-                    legacy_payload = {"model": self._model, "prompt": text}
-                    response = await client.post(f"{self._base_url}/api/embeddings", json=legacy_payload)
+            response = await self._http_client.post(
+                f"{self._base_url}/api/embed",
+                content=orjson.dumps(payload),
+                headers=JSON_HEADERS,
+                timeout=self._timeout_seconds,
+            )
+            if response.status_code == 404:
+                legacy_payload = {"model": self._model, "prompt": text}
+                response = await self._http_client.post(
+                    f"{self._base_url}/api/embeddings",
+                    content=orjson.dumps(legacy_payload),
+                    headers=JSON_HEADERS,
+                    timeout=self._timeout_seconds,
+                )
         except httpx.TimeoutException as exc:
             raise ProviderTimeoutError("Ollama embedding request timed out") from exc
 
         if response.status_code >= 500:
             raise ProviderServerError(f"Ollama embedding server error: {response.status_code}")
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         vector: list[float]
         if isinstance(data.get("embedding"), list):
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import httpx
 
 from her.config.settings import Settings
 from her.embeddings.base import EmbeddingProvider
@@ -9,7 +13,9 @@ from her.embeddings.ollama_provider import OllamaEmbeddingProvider
 from her.observability.logging import get_logger
 
 
-def build_embedding_provider(settings: Settings) -> Optional[EmbeddingProvider]:
+def build_embedding_provider(
+    settings: Settings, http_client: httpx.AsyncClient
+) -> Optional[EmbeddingProvider]:
     """Construct embedding provider from runtime settings."""
 
     provider = settings.embedding_provider.lower().strip()
@@ -21,6 +27,7 @@ def build_embedding_provider(settings: Settings) -> Optional[EmbeddingProvider]:
             model=settings.custom_embedding_model,
             timeout_seconds=settings.request_timeout_seconds,
             dimensions=settings.embedding_dimensions,
+            http_client=http_client,
             api_key=settings.custom_embedding_api_key,
         )
     return OllamaEmbeddingProvider(
@@ -28,15 +35,29 @@ def build_embedding_provider(settings: Settings) -> Optional[EmbeddingProvider]:
         model=settings.ollama_embedding_model,
         timeout_seconds=settings.request_timeout_seconds,
         dimensions=settings.embedding_dimensions,
+        http_client=http_client,
     )
 
 
 class EmbeddingService:
-    """Safe embedding facade that degrades gracefully on provider failures."""
+    """Safe embedding facade that degrades gracefully on provider failures.
+
+    Successful embeddings are kept in a bounded LRU cache with a TTL so
+    repeated texts skip the provider round-trip.
+    """
 
-    def __init__(self, provider: Optional[EmbeddingProvider], dimensions: int) -> None:
+    def __init__(
+        self,
+        provider: Optional[EmbeddingProvider],
+        dimensions: int,
+        cache_size: int = 512,
+        cache_ttl_seconds: float = 300.0,
+    ) -> None:
         self._provider = provider
         self._dimensions = dimensions
+        self._cache_size = cache_size
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._cache: OrderedDict[str, Tuple[float, list[float]]] = OrderedDict()
         self._logger = get_logger("embedding_service")
 
     async def embed(self, text: str) -> Optional[list[float]]:
@@ -44,8 +65,13 @@ class EmbeddingService:
 
         if self._provider is None:
             return None
+
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
         try:
-            return await self._provider.embed(text)
+            vector = await self._provider.embed(text)
         except Exception as exc:
             self._logger.warning(
                 "embedding_provider_failed",
@@ -53,3 +79,25 @@ class EmbeddingService:
                 error=str(exc),
             )
             return None
+
+        self._cache_put(text, vector)
+        return vector
+
+    def _cache_get(self, text: str) -> Optional[list[float]]:
+        entry = self._cache.get(text)
+        if entry is None:
+            return None
+        expires_at, vector = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[text]
+            return None
+        self._cache.move_to_end(text)
+        return vector
+
+    def _cache_put(self, text: str, vector: list[float]) -> None:
+        if self._cache_size <= 0:
+            return
+        self._cache[text] = (time.monotonic() + self._cache_ttl_seconds, vector)
+        self._cache.move_to_end(text)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable
+import re
+from functools import lru_cache
+from typing import Iterable, Pattern, Tuple
 
 
 DISALLOWED_PATTERNS = (
@@ -13,5 +15,15 @@ DISALLOWED_PATTERNS = (
 def contains_disallowed_content(text: str, patterns: Iterable[str] = DISALLOWED_PATTERNS) -> bool:
     """Return True when text contains disallowed patterns."""
 
-    normalized = text.lower()
-    return any(pattern in normalized for pattern in patterns)
+    matcher = _compile_patterns(patterns if isinstance(patterns, tuple) else tuple(patterns))
+    if matcher is None:
+        return False
+    return matcher.search(text.lower()) is not None
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Pattern[str] | None:
+    # One alternation scans the text once instead of once per pattern.
+    if not patterns:
+        return None
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns))
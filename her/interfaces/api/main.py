@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
 from contextlib import asynccontextmanager
-from pathlib import Path
 
-from fastapi import FastAPI, Response
+from fastapi import APIRouter, FastAPI
 
 from her.agents.conversation import ConversationAgent
 from her.agents.orchestrator import AgentOrchestrator
@@ -13,33 +13,49 @@ from her.agents.token_budget import TokenBudgetManager
 from her.config.settings import get_settings
 from her.embeddings.service import EmbeddingService, build_embedding_provider
 from her.guardrails.ethical_core import EthicalCore
+from her.interfaces.api.middleware.auth import BearerAuthMiddleware
+from her.interfaces.api.middleware.body_limit import BodySizeLimitMiddleware
 from her.interfaces.api.middleware.request_id import RequestIDMiddleware
+from her.interfaces.api.openapi import install_cached_openapi
 from her.interfaces.api.routes.chat import router as chat_router
+from her.interfaces.api.routes.goals import MAX_GOALS_LIMIT
 from her.interfaces.api.routes.goals import router as goals_router
 from her.interfaces.api.routes.health import router as health_router
 from her.interfaces.api.routes.memory import router as memory_router
+from her.interfaces.api.routes.metrics import router as metrics_router
 from her.interfaces.api.routes.state import router as state_router
 from her.interfaces.api.routes.ws import router as ws_router
 from her.memory.db import MemoryDatabase
+from her.memory.snapshots import ActiveGoalSnapshot
 from her.memory.store import MemoryStore
 from her.memory.working import WorkingMemory
 from her.observability.logging import configure_logging, get_logger
-from her.observability.metrics import metrics_content_type, metrics_payload
 from her.observability.tracing import setup_tracing
-from her.personality.drift_engine import DriftEngine
-from her.personality.manager import PersonalityManager
+from her.personality.manager import build_personality_manager
 from her.personality.vector import (
-    load_drift_config,
+    DEFAULT_BASELINE_PATH,
     load_emotional_baseline,
     load_personality_baseline,
 )
 from her.providers.anthropic_provider import AnthropicProvider
 from her.providers.custom_provider import CustomProvider
 from her.providers.fallback_router import FallbackRouter
+from her.providers.http_client import create_provider_http_client
 from her.providers.ollama_provider import OllamaProvider
 from her.providers.openai_provider import OpenAIProvider
 
 
+# Starlette matches routes in registration order, so the busiest endpoints go first.
+ROUTERS: tuple[APIRouter, ...] = (
+    chat_router,
+    ws_router,
+    health_router,
+    metrics_router,
+    memory_router,
+    state_router,
+    goals_router,
+)
+
 settings = get_settings()
 configure_logging(settings.log_level)
 setup_tracing(settings.app_name)
@@ -49,36 +65,51 @@ logger = get_logger("api_main")
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
 
+    provider_http_client = create_provider_http_client(
+        max_connections=settings.provider_http_max_connections,
+        max_keepalive_connections=settings.provider_http_max_keepalive_connections,
+    )
     providers = {
-        "openai": OpenAIProvider(settings),
-        "anthropic": AnthropicProvider(settings),
-        "custom": CustomProvider(settings),
-        "ollama": OllamaProvider(settings),
+        "openai": OpenAIProvider(settings, provider_http_client),
+        "anthropic": AnthropicProvider(settings, provider_http_client),
+        "custom": CustomProvider(settings, provider_http_client),
+        "ollama": OllamaProvider(settings, provider_http_client),
     }
     ordered = [providers[name] for name in settings.provider_priority if name in providers]
     router = FallbackRouter(ordered, timeout_seconds=settings.request_timeout_seconds)
 
-    memory_database = MemoryDatabase(settings.database_url)
+    memory_database = MemoryDatabase(
+        settings.database_url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_recycle_seconds=settings.database_pool_recycle_seconds,
+        statement_cache_size=settings.database_statement_cache_size,
+    )
     memory_store = MemoryStore(memory_database)
     working_memory = WorkingMemory(
         redis_url=settings.redis_url,
         ttl_minutes=settings.working_memory_ttl_minutes,
+        stream_max_length=settings.event_stream_max_length,
+        events_enabled=settings.event_stream_enabled,
+        redis_enabled=settings.redis_enabled,
+        event_sample_rate=settings.event_stream_sample_rate,
+        max_connections=settings.redis_max_connections,
+        health_check_interval=settings.redis_health_check_interval_seconds,
     )
-    baseline_path = Path(__file__).resolve().parents[2] / "config" / "personality_baseline.yaml"
-    baseline_personality = load_personality_baseline(baseline_path)
-    baseline_emotion = load_emotional_baseline(baseline_path)
-    drift_config = load_drift_config(baseline_path)
-    personality_manager = PersonalityManager(
-        baseline_personality=baseline_personality,
-        baseline_emotion=baseline_emotion,
-        drift_engine=DriftEngine(baseline_personality, config=drift_config),
-        snapshot_store=memory_store,
-    )
+    personality_manager = build_personality_manager(snapshot_store=memory_store)
     embedding_service = EmbeddingService(
-        provider=build_embedding_provider(settings),
+        provider=build_embedding_provider(settings, provider_http_client),
         dimensions=settings.embedding_dimensions,
+        cache_size=settings.embedding_cache_size,
+        cache_ttl_seconds=settings.embedding_cache_ttl_seconds,
     )
     token_budget = TokenBudgetManager(max_input_tokens=settings.conversation_token_budget)
+    # Sized for the largest /goals page; the conversation agent trims to its own limit.
+    goal_snapshot = ActiveGoalSnapshot(
+        memory_store,
+        limit=max(settings.active_goal_limit, MAX_GOALS_LIMIT),
+        refresh_seconds=settings.goal_snapshot_refresh_seconds,
+    )
 
     conversation_agent = ConversationAgent(
         router=router,
@@ -91,12 +122,18 @@ def create_app() -> FastAPI:
         semantic_top_k=settings.semantic_top_k,
         recent_episode_limit=settings.recent_episode_limit,
         active_goal_limit=settings.active_goal_limit,
+        goal_snapshot=goal_snapshot,
     )
 
     @asynccontextmanager
     async def lifespan(_: FastAPI) -> AsyncIterator[None]:
-        healthy = await memory_database.healthcheck()
-        if healthy:
+        # Database and Redis are independent, so probe them together; the Redis
+        # probe also warms the connection pool ahead of the first request.
+        db_healthy, _redis_ok = await asyncio.gather(
+            memory_database.healthcheck(),
+            working_memory.healthcheck(),
+        )
+        if db_healthy:
             logger.info("memory_database_ready")
             latest_snapshot = await memory_store.get_latest_personality_snapshot()
             if latest_snapshot is not None:
@@ -104,41 +141,56 @@ def create_app() -> FastAPI:
                 logger.info("personality_restored_from_snapshot", snapshot_at=str(latest_snapshot.snapshot_at))
         else:
             logger.warning("memory_database_unreachable", database_url=settings.database_url)
+        # Started either way: the loop keeps retrying until the database is back.
+        goal_snapshot.start()
         try:
             yield
         finally:
-            await working_memory.close()
-            await memory_database.dispose()
+            await asyncio.gather(
+                _shutdown_step("goal_snapshot", goal_snapshot.stop()),
+                _shutdown_step("personality_snapshots", personality_manager.flush()),
+                _shutdown_step("working_memory", working_memory.close()),
+                _shutdown_step("provider_http_client", provider_http_client.aclose()),
+            )
+            await _shutdown_step("memory_database", memory_database.dispose())
 
     app = FastAPI(title=settings.app_name, lifespan=lifespan)
+    # The last middleware added runs first, so RequestID wraps the others and
+    # their 401/413 responses still carry an x-request-id header.
+    app.add_middleware(BodySizeLimitMiddleware, max_body_bytes=settings.api_max_body_bytes)
+    if settings.api_bearer_token:
+        app.add_middleware(BearerAuthMiddleware, token=settings.api_bearer_token)
     app.add_middleware(RequestIDMiddleware)
 
-    app.state.orchestrator = AgentOrchestrator(conversation_agent)
+    app.state.orchestrator = AgentOrchestrator(
+        conversation_agent, max_inflight=settings.max_inflight_interactions
+    )
     app.state.reflection_agent = ReflectionAgent(memory_store, personality_manager)
+    app.state.goal_snapshot = goal_snapshot
     app.state.memory_database = memory_database
+    app.state.provider_http_client = provider_http_client
     app.state.memory_store = memory_store
     app.state.working_memory = working_memory
-    app.state.personality_baseline = baseline_personality
-    app.state.emotional_baseline = baseline_emotion
+    app.state.personality_baseline = load_personality_baseline(DEFAULT_BASELINE_PATH)
+    app.state.emotional_baseline = load_emotional_baseline(DEFAULT_BASELINE_PATH)
     app.state.personality_manager = personality_manager
     app.state.embedding_service = embedding_service
     app.state.token_budget = token_budget
     app.state.settings = settings
 
-    app.include_router(health_router)
-    app.include_router(chat_router)
-    app.include_router(memory_router)
-    app.include_router(state_router)
-    app.include_router(goals_router)
-    app.include_router(ws_router)
+    for api_router in ROUTERS:
+        app.include_router(api_router)
 
-    @app.get("/metrics")
-    async def metrics() -> Response:
-        """Expose Prometheus metrics."""
+    install_cached_openapi(app)
+    return app
 
-        return Response(content=metrics_payload(), media_type=metrics_content_type())
 
-    return app
+async def _shutdown_step(name: str, step: Awaitable[None]) -> None:
+    # One failing resource must not stop the others from being released.
+    try:
+        await step
+    except Exception as exc:
+        logger.warning("shutdown_step_failed", step=name, error=str(exc))
 
 
 app = create_app()
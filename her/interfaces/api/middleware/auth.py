@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import hmac
+from typing import FrozenSet
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+PUBLIC_PATHS: FrozenSet[str] = frozenset({"/health", "/metrics"})
+
+
+class BearerAuthMiddleware:
+    """Require a static bearer token on every non-public HTTP and WebSocket request."""
+
+    def __init__(self, app: ASGIApp, token: str, public_paths: FrozenSet[str] = PUBLIC_PATHS) -> None:
+        self._app = app
+        self._expected = b"Bearer " + token.encode("utf-8")
+        self._public_paths = public_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket") or scope["path"] in self._public_paths:
+            await self._app(scope, receive, send)
+            return
+
+        provided = b""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                provided = value
+                break
+
+        if hmac.compare_digest(provided, self._expected):
+            await self._app(scope, receive, send)
+            return
+
+        if scope["type"] == "websocket":
+            await send({"type": "websocket.close", "code": 1008})
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 401,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"www-authenticate", b"Bearer"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b'{"detail":"Unauthorized"}'})
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import hashlib
+
+import orjson
+from fastapi import FastAPI
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import BaseRoute, Route
+
+
+def install_cached_openapi(app: FastAPI) -> None:
+    """Serve the OpenAPI schema as bytes rendered once, with an ETag.
+
+    Call after all routes are registered; routes added later are not
+    reflected in the served schema.
+    """
+
+    if app.openapi_url is None:
+        return
+
+    body = orjson.dumps(app.openapi())
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    async def openapi_schema(request: Request) -> Response:
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    path = app.openapi_url
+    app.router.routes[:] = [route for route in app.router.routes if not _is_path(route, path)]
+    app.router.routes.append(Route(path, openapi_schema, methods=["GET"], include_in_schema=False))
+
+
+def _is_path(route: BaseRoute, path: str) -> bool:
+    return isinstance(route, Route) and route.path == path
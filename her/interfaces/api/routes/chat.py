@@ -2,26 +2,32 @@ from __future__ import annotations
 
 from typing import Any, cast
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request
 
+from her.agents.orchestrator import OrchestratorBusyError
 from her.models import ChatRequest, ChatResponse
 from her.observability.metrics import REQUEST_COUNTER
 
 router = APIRouter()
 
+_REQUESTS = REQUEST_COUNTER.labels(route="chat")
+
 
 @router.post("/chat", response_model=ChatResponse)
 async def chat(payload: ChatRequest, request: Request) -> ChatResponse:
     """Handle chat input and return HER response."""
 
-    REQUEST_COUNTER.labels(route="chat").inc()
+    _REQUESTS.inc()
     orchestrator = request.app.state.orchestrator
     trace_id = cast(str, cast(Any, request.state).request_id)
-    llm_response = await orchestrator.handle_interaction(
-        session_id=payload.session_id,
-        content=payload.content,
-        trace_id=trace_id,
-    )
+    try:
+        llm_response = await orchestrator.handle_interaction(
+            session_id=payload.session_id,
+            content=payload.content,
+            trace_id=trace_id,
+        )
+    except OrchestratorBusyError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
     return ChatResponse(
         content=llm_response.content,
         provider=llm_response.provider,
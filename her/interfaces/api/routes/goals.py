@@ -9,17 +9,19 @@ from her.observability.metrics import REQUEST_COUNTER
 
 router = APIRouter()
 
+_REQUESTS = REQUEST_COUNTER.labels(route="goals")
+
+MAX_GOALS_LIMIT = 100
 
-@router.get("/goals", response_model=List[GoalResponse])
-async def list_goals(request: Request, limit: int = Query(10, ge=1, le=100)) -> List[GoalResponse]:
-    """Return active goals."""
 
-    REQUEST_COUNTER.labels(route="goals").inc()
-    try:
-        goals = await request.app.state.memory_store.list_active_goals(limit=limit)
-    except Exception:
-        return []
+@router.get("/goals", response_model=List[GoalResponse])
+async def list_goals(
+    request: Request, limit: int = Query(10, ge=1, le=MAX_GOALS_LIMIT)
+) -> List[GoalResponse]:
+    """Return active goals from the shared active-goal snapshot."""
 
+    _REQUESTS.inc()
+    goals = await request.app.state.goal_snapshot.get()
     return [
         GoalResponse(
             id=goal.id,
@@ -29,5 +31,5 @@ async def list_goals(request: Request, limit: int = Query(10, ge=1, le=100)) ->
             created_at=goal.created_at,
             last_progressed=goal.last_progressed,
         )
-        for goal in goals
+        for goal in goals[:limit]
     ]
@@ -1,15 +1,56 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Tuple
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 router = APIRouter()
 
+DEPENDENCY_CHECK_TTL_SECONDS = 30.0
+
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
 
 @router.get("/health")
-async def health() -> Dict[str, str]:
-    """Return service health snapshot."""
+async def health(request: Request) -> Dict[str, str]:
+    """Return service health snapshot with cached dependency checks."""
+
+    dependencies = await _dependency_status(request.app.state)
+    healthy = all(value in {"ok", "disabled"} for value in dependencies.values())
+    status = "ok" if healthy else "degraded"
+    return {"status": status, "time": _now_iso(), **dependencies}
+
+
+def _now_iso() -> str:
+    global _timestamp_cache
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, datetime.fromtimestamp(second, tz=timezone.utc).isoformat())
+    return _timestamp_cache[1]
+
+
+async def _dependency_status(state: Any) -> Dict[str, str]:
+    cached: Tuple[float, Dict[str, str]] | None = getattr(state, "health_cache", None)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < DEPENDENCY_CHECK_TTL_SECONDS:
+        return cached[1]
+
+    database_ok, redis_ok = await asyncio.gather(
+        state.memory_database.healthcheck(),
+        state.working_memory.healthcheck(),
+    )
+    dependencies = {
+        "database": "ok" if database_ok else "unavailable",
+        "redis": _redis_status(state.working_memory, redis_ok),
+    }
+    state.health_cache = (now, dependencies)
+    return dependencies
+
 
-    return {"status": "ok", "time": datetime.utcnow().isoformat()}
+def _redis_status(working_memory: Any, healthy: bool) -> str:
+    if not working_memory.redis_enabled:
+        return "disabled"
+    return "ok" if healthy else "unavailable"
@@ -7,6 +7,8 @@ from her.observability.metrics import REQUEST_COUNTER
 
 router = APIRouter()
 
+_REQUESTS = REQUEST_COUNTER.labels(route="memory.search")
+
 
 @router.get("/memory/search", response_model=MemorySearchResponse)
 async def memory_search(
@@ -16,7 +18,7 @@ async def memory_search(
 ) -> MemorySearchResponse:
     """Search semantic memory by embedding similarity."""
 
-    REQUEST_COUNTER.labels(route="memory.search").inc()
+    _REQUESTS.inc()
     embedding = await request.app.state.embedding_service.embed(q)
     if embedding is None:
         return MemorySearchResponse(query=q, items=[])
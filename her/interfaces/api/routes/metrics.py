@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Response
+
+from her.observability.metrics import metrics_content_type, metrics_payload
+
+router = APIRouter()
+
+
+# A plain def runs in the threadpool, so rendering the registry does not
+# block the event loop while chat and WebSocket traffic is in flight.
+@router.get("/metrics")
+def metrics() -> Response:
+    """Expose Prometheus metrics."""
+
+    return Response(content=metrics_payload(), media_type=metrics_content_type())
@@ -7,12 +7,14 @@ from her.observability.metrics import REQUEST_COUNTER
 
 router = APIRouter()
 
+_REQUESTS = REQUEST_COUNTER.labels(route="state")
+
 
 @router.get("/state", response_model=StateResponse)
 async def state(request: Request) -> StateResponse:
     """Return current runtime personality/emotion and provider state."""
 
-    REQUEST_COUNTER.labels(route="state").inc()
+    _REQUESTS.inc()
     settings = request.app.state.settings
     manager = request.app.state.personality_manager
     return StateResponse(
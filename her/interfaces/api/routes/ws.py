@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from typing import Any, Dict, Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from her.agents.orchestrator import OrchestratorBusyError
+
 router = APIRouter()
 
+# Error replies never change, so their frames are encoded once.
+INVALID_PAYLOAD_FRAME = orjson.dumps({"error": "payload must be a JSON object"}).decode()
+INVALID_SESSION_FRAME = orjson.dumps({"error": "session_id must be a UUID"}).decode()
+MISSING_CONTENT_FRAME = orjson.dumps({"error": "content is required"}).decode()
+
 
 @router.websocket("/ws")
 async def websocket_chat(websocket: WebSocket) -> None:
@@ -14,27 +23,53 @@ async def websocket_chat(websocket: WebSocket) -> None:
     await websocket.accept()
     try:
         while True:
-            payload = await websocket.receive_json()
-            session_id = UUID(str(payload.get("session_id")))
+            payload = _decode_payload(await websocket.receive_text())
+            if payload is None:
+                await websocket.send_text(INVALID_PAYLOAD_FRAME)
+                continue
+            session_id = _coerce_session_id(payload.get("session_id"))
+            if session_id is None:
+                await websocket.send_text(INVALID_SESSION_FRAME)
+                continue
             content = str(payload.get("content", "")).strip()
             if not content:
-                await websocket.send_json({"error": "content is required"})
+                await websocket.send_text(MISSING_CONTENT_FRAME)
                 continue
 
             trace_id = str(payload.get("trace_id") or "ws-trace")
-            llm_response = await websocket.app.state.orchestrator.handle_interaction(
-                session_id=session_id,
-                content=content,
-                trace_id=trace_id,
-            )
-            await websocket.send_json(
-                {
-                    "content": llm_response.content,
-                    "provider": llm_response.provider,
-                    "model": llm_response.model,
-                    "cost_usd": llm_response.cost_usd,
-                    "trace_id": trace_id,
-                }
-            )
+            try:
+                llm_response = await websocket.app.state.orchestrator.handle_interaction(
+                    session_id=session_id,
+                    content=content,
+                    trace_id=trace_id,
+                )
+            except OrchestratorBusyError as exc:
+                await websocket.send_text(orjson.dumps({"error": str(exc)}).decode())
+                continue
+            reply = {
+                "content": llm_response.content,
+                "provider": llm_response.provider,
+                "model": llm_response.model,
+                "cost_usd": llm_response.cost_usd,
+                "trace_id": trace_id,
+            }
+            await websocket.send_text(orjson.dumps(reply).decode())
     except WebSocketDisconnect:
         return
+
+
+def _decode_payload(raw: str) -> Optional[Dict[str, Any]]:
+    try:
+        payload = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _coerce_session_id(value: Any) -> Optional[UUID]:
+    if isinstance(value, str):
+        try:
+            return UUID(value)
+        except ValueError:
+            return None
+    return None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 from typing import Any
 from uuid import NAMESPACE_URL, UUID, uuid5
 
@@ -36,6 +37,7 @@ class TelegramBotInterface:
         self._memory_store = memory_store
         self._personality = personality_manager
         self._application: Any | None = None
+        self._stopped = asyncio.Event()
 
     def build_application(self) -> Any:
         """Build and configure Telegram application handlers."""
@@ -52,10 +54,23 @@ class TelegramBotInterface:
         return app
 
     async def start(self) -> None:
-        """Start Telegram polling loop."""
+        """Poll Telegram on the running event loop until `stop` is called."""
 
         app = self._application or self.build_application()
-        await asyncio.to_thread(app.run_polling, close_loop=False)
+        self._stopped.clear()
+        async with app:
+            await app.start()
+            await app.updater.start_polling()
+            try:
+                await self._stopped.wait()
+            finally:
+                await app.updater.stop()
+                await app.stop()
+
+    def stop(self) -> None:
+        """Signal the polling loop started by `start` to shut down."""
+
+        self._stopped.set()
 
     async def _handle_reflect(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         del context
@@ -120,5 +135,6 @@ class TelegramBotInterface:
         await message.reply_text(response.content)
 
 
+@lru_cache(maxsize=4096)
 def _session_id_for_chat(chat_id: int) -> UUID:
     return uuid5(NAMESPACE_URL, f"telegram:{chat_id}")
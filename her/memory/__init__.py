@@ -3,11 +3,13 @@ from her.memory.db import MemoryDatabase
 from her.memory.episodic import EpisodicMemoryStore
 from her.memory.models import Base
 from her.memory.semantic import SemanticMemoryStore
+from her.memory.snapshots import ActiveGoalSnapshot
 from her.memory.store import MemoryStore
 from her.memory.types import GoalRecord, PersonalitySnapshotRecord, SemanticMemoryRecord
 from her.memory.working import WorkingMemory
 
 __all__ = [
+    "ActiveGoalSnapshot",
     "Base",
     "GoalRecord",
     "PersonalitySnapshotRecord",
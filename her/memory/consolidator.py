@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict
+from dataclasses import replace
+from typing import Dict, List
 
 from her.memory.semantic import SemanticMemoryStore
+from her.memory.types import SemanticMemoryRecord
 
 
 class MemoryConsolidator:
@@ -17,7 +19,7 @@ class MemoryConsolidator:
 
         records = await self._semantic_store.all_records()
         canonical: Dict[str, str] = {}
-        updates = 0
+        merged: List[SemanticMemoryRecord] = []
 
         for record in records:
             if record.confidence < self._confidence_threshold:
@@ -31,15 +33,10 @@ class MemoryConsolidator:
                 continue
             merged_summary = f"{existing_summary} {record.summary}".strip()
             if merged_summary != record.summary:
-                await self._semantic_store.upsert_concept(
-                    concept=record.concept,
-                    summary=merged_summary,
-                    episode_id=record.source_episode_ids[0],
-                    tags=record.tags,
-                )
-                updates += 1
-
-        return updates
+                merged.append(replace(record, summary=merged_summary))
+
+        await self._semantic_store.reinforce_concepts(merged)
+        return len(merged)
 
 
 
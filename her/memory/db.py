@@ -2,16 +2,37 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Any, Dict
 
-from sqlalchemy import text
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 
 class MemoryDatabase:
     """Async SQLAlchemy engine/session manager for memory operations."""
 
-    def __init__(self, database_url: str, echo: bool = False) -> None:
-        self._engine: AsyncEngine = create_async_engine(database_url, echo=echo, pool_pre_ping=True)
+    def __init__(
+        self,
+        database_url: str,
+        echo: bool = False,
+        pool_size: int = 10,
+        max_overflow: int = 10,
+        pool_recycle_seconds: int = 1800,
+        statement_cache_size: int = 500,
+    ) -> None:
+        connect_args: Dict[str, Any] = {}
+        if make_url(database_url).get_driver_name() == "asyncpg":
+            connect_args["prepared_statement_cache_size"] = statement_cache_size
+
+        self._engine: AsyncEngine = create_async_engine(
+            database_url,
+            echo=echo,
+            pool_pre_ping=True,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle_seconds,
+            connect_args=connect_args,
+        )
         self._session_factory = async_sessionmaker(self._engine, expire_on_commit=False)
 
     @property
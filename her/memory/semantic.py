@@ -31,6 +31,11 @@ class SemanticMemoryStore:
             embedding=embedding,
         )
 
+    async def reinforce_concepts(self, updates: List[SemanticMemoryRecord]) -> List[SemanticMemoryRecord]:
+        """Reinforce several concepts in one batch with ``upsert_concept`` semantics."""
+
+        return await self._memory_store.reinforce_semantic_summaries(updates)
+
     async def search(
         self,
         query_embedding: List[float],
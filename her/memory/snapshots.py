@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import List, Optional, Protocol
+
+from her.memory.types import GoalRecord
+from her.observability.logging import get_logger
+from her.utils.compat import async_timeout
+
+
+class ActiveGoalSource(Protocol):
+    """Goal listing protocol used by the active goal snapshot."""
+
+    async def list_active_goals(self, limit: int = 20) -> List[GoalRecord]:
+        """Return active goals ordered by priority."""
+
+
+class ActiveGoalSnapshot:
+    """Background-refreshed snapshot of active goals for the request path.
+
+    Goals change rarely compared to how often they are read, so the listing
+    query runs on a timer and readers get the latest snapshot without a
+    database round-trip. Writers call ``mark_stale`` after changing goals so
+    the snapshot reloads right away instead of on the next tick. A failed load
+    is not retried by readers until ``failure_backoff_seconds`` have passed, so
+    an unreachable database does not cost every request a query.
+    """
+
+    def __init__(
+        self,
+        source: ActiveGoalSource,
+        limit: int = 5,
+        refresh_seconds: float = 10.0,
+        failure_backoff_seconds: float = 5.0,
+    ) -> None:
+        self._source = source
+        self._limit = limit
+        self._refresh_seconds = refresh_seconds
+        self._failure_backoff_seconds = failure_backoff_seconds
+        self._goals: Optional[List[GoalRecord]] = None
+        self._retry_at = 0.0
+        # Created on first use so they bind to the loop that serves requests.
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._stale: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._logger = get_logger("active_goal_snapshot")
+
+    async def get(self) -> List[GoalRecord]:
+        """Return the latest snapshot, loading it lazily on first use.
+
+        The list is shared with other readers and must not be mutated; a
+        refresh replaces it rather than updating it in place.
+        """
+
+        if self._goals is None and time.monotonic() >= self._retry_at:
+            async with self._lock():
+                # Readers that queued behind the first load reuse its result.
+                if self._goals is None and time.monotonic() >= self._retry_at:
+                    await self._load()
+        return self._goals if self._goals is not None else []
+
+    async def refresh(self) -> None:
+        """Reload active goals from the source into the snapshot."""
+
+        async with self._lock():
+            await self._load()
+
+    def mark_stale(self) -> None:
+        """Signal that goals changed so the snapshot reloads before its next tick.
+
+        With the refresh loop running this wakes it immediately; otherwise the
+        snapshot is dropped and the next ``get`` loads it again.
+        """
+
+        if self._task is None or self._task.done() or self._stale is None:
+            self._goals = None
+            self._retry_at = 0.0
+        else:
+            self._stale.set()
+
+    def start(self) -> None:
+        """Start the periodic refresh loop on the running event loop.
+
+        The loop keeps retrying on its own schedule, so it is safe to start
+        while the source is still unreachable.
+        """
+
+        if self._task is None or self._task.done():
+            self._stale = asyncio.Event()
+            self._task = asyncio.create_task(self._run(self._stale))
+
+    async def stop(self) -> None:
+        """Stop the periodic refresh loop."""
+
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def _lock(self) -> asyncio.Lock:
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        return self._refresh_lock
+
+    async def _load(self) -> None:
+        try:
+            self._goals = await self._source.list_active_goals(limit=self._limit)
+        except Exception as exc:
+            self._retry_at = time.monotonic() + self._failure_backoff_seconds
+            self._logger.warning("active_goal_snapshot_refresh_failed", error=str(exc))
+        else:
+            self._retry_at = 0.0
+
+    async def _run(self, stale: asyncio.Event) -> None:
+        while True:
+            stale.clear()
+            await self.refresh()
+            with contextlib.suppress(asyncio.TimeoutError):
+                async with async_timeout(self._refresh_seconds):
+                    await stale.wait()
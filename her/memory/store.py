@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 from uuid import UUID
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import CursorResult, Numeric, Select, func, insert, or_, select, update
+from sqlalchemy import cast as sql_cast
 
 from her.models import Episode
 from her.memory.db import MemoryDatabase
@@ -36,22 +37,24 @@ class MemoryStore:
         """Insert an episode and return the canonical model."""
 
         payload_metadata = metadata or {}
-        episode_row = EpisodeORM(
-            session_id=session_id,
-            content=content,
-            embedding=embedding,
-            emotional_valence=max(-1.0, min(1.0, emotional_valence)),
-            importance_score=max(0.0, min(1.0, importance_score)),
-            decay_factor=1.0,
-            archived=False,
-            metadata_json=payload_metadata,
+        stmt = (
+            insert(EpisodeORM)
+            .values(
+                session_id=session_id,
+                content=content,
+                embedding=embedding,
+                emotional_valence=max(-1.0, min(1.0, emotional_valence)),
+                importance_score=max(0.0, min(1.0, importance_score)),
+                decay_factor=1.0,
+                archived=False,
+                metadata_json=payload_metadata,
+            )
+            .returning(EpisodeORM)
         )
 
         async with self._database.session() as session:
-            session.add(episode_row)
-            await session.flush()
+            episode_row = (await session.scalars(stmt)).one()
             await session.commit()
-            await session.refresh(episode_row)
 
         return _episode_from_orm(episode_row)
 
@@ -107,19 +110,21 @@ class MemoryStore:
             existing = (await session.execute(stmt)).scalars().first()
 
             if existing is None:
-                record = SemanticMemoryORM(
-                    concept=normalized,
-                    summary=summary,
-                    embedding=embedding,
-                    confidence=1.0,
-                    source_episode_ids=[episode_id],
-                    last_reinforced=datetime.utcnow(),
-                    tags=input_tags,
+                insert_stmt = (
+                    insert(SemanticMemoryORM)
+                    .values(
+                        concept=normalized,
+                        summary=summary,
+                        embedding=embedding,
+                        confidence=1.0,
+                        source_episode_ids=[episode_id],
+                        last_reinforced=datetime.utcnow(),
+                        tags=input_tags,
+                    )
+                    .returning(SemanticMemoryORM)
                 )
-                session.add(record)
-                await session.flush()
+                record = (await session.scalars(insert_stmt)).one()
                 await session.commit()
-                await session.refresh(record)
                 return _semantic_from_orm(record)
 
             existing.summary = summary
@@ -136,6 +141,54 @@ class MemoryStore:
             await session.refresh(existing)
             return _semantic_from_orm(existing)
 
+    async def reinforce_semantic_summaries(
+        self, updates: List[SemanticMemoryRecord]
+    ) -> List[SemanticMemoryRecord]:
+        """Apply several ``upsert_semantic_concept`` reinforcements in one load and commit.
+
+        Each update targets the first record sharing its concept case-insensitively,
+        replaces that record's summary, and merges in the update's first source
+        episode and its tags, exactly as the one-at-a-time upsert does.
+        """
+
+        if not updates:
+            return []
+
+        concepts = {update.concept.strip().lower() for update in updates}
+        stmt = (
+            select(SemanticMemoryORM)
+            .where(func.lower(SemanticMemoryORM.concept).in_(concepts))
+            .order_by(SemanticMemoryORM.created_at.asc())
+        )
+        async with self._database.session() as session:
+            targets: Dict[str, SemanticMemoryORM] = {}
+            for row in (await session.execute(stmt)).scalars().all():
+                targets.setdefault(row.concept.lower(), row)
+
+            reinforced_at = datetime.utcnow()
+            touched: Dict[UUID, SemanticMemoryORM] = {}
+            for update in updates:
+                target = targets.get(update.concept.strip().lower())
+                if target is None:
+                    continue
+                target.summary = update.summary
+                target.confidence = min(1.0, target.confidence + 0.05)
+                target.last_reinforced = reinforced_at
+                episode_ids = list(target.source_episode_ids)
+                for episode_id in update.source_episode_ids[:1]:
+                    if episode_id not in episode_ids:
+                        episode_ids.append(episode_id)
+                target.source_episode_ids = episode_ids
+                tags = list(target.tags)
+                for tag in update.tags:
+                    if tag not in tags:
+                        tags.append(tag)
+                target.tags = tags
+                touched[target.id] = target
+            await session.commit()
+
+        return [_semantic_from_orm(row) for row in touched.values()]
+
     async def semantic_search(
         self,
         query_embedding: List[float],
@@ -170,18 +223,20 @@ class MemoryStore:
     async def create_goal(self, description: str, priority: float = 0.5) -> GoalRecord:
         """Insert a goal row and return a transfer object."""
 
-        goal_row = GoalORM(
-            description=description,
-            status="active",
-            priority=max(0.0, min(1.0, priority)),
-            metadata_json={},
-            linked_episodes=[],
+        stmt = (
+            insert(GoalORM)
+            .values(
+                description=description,
+                status="active",
+                priority=max(0.0, min(1.0, priority)),
+                metadata_json={},
+                linked_episodes=[],
+            )
+            .returning(GoalORM)
         )
         async with self._database.session() as session:
-            session.add(goal_row)
-            await session.flush()
+            goal_row = (await session.scalars(stmt)).one()
             await session.commit()
-            await session.refresh(goal_row)
         return _goal_from_orm(goal_row)
 
     async def list_active_goals(self, limit: int = 20) -> List[GoalRecord]:
@@ -200,50 +255,62 @@ class MemoryStore:
     async def decay_and_archive_episodes(self, daily_decay: float = 0.95) -> int:
         """Decay episode relevance and archive stale low-importance rows."""
 
-        archived_count = 0
-        stmt: Select[tuple[EpisodeORM]] = select(EpisodeORM).where(EpisodeORM.archived.is_(False))
+        decay_stmt = (
+            update(EpisodeORM)
+            .where(EpisodeORM.archived.is_(False))
+            .values(decay_factor=func.round(sql_cast(EpisodeORM.decay_factor * daily_decay, Numeric), 4))
+            .execution_options(synchronize_session=False)
+        )
+        archive_stmt = (
+            update(EpisodeORM)
+            .where(EpisodeORM.archived.is_(False))
+            .where(EpisodeORM.decay_factor < 0.1)
+            .where(EpisodeORM.importance_score < 0.3)
+            .values(archived=True)
+            .execution_options(synchronize_session=False)
+        )
 
         async with self._database.session() as session:
-            rows = (await session.execute(stmt)).scalars().all()
-            for row in rows:
-                row.decay_factor = round(row.decay_factor * daily_decay, 4)
-                if row.decay_factor < 0.1 and row.importance_score < 0.3:
-                    row.archived = True
-                    archived_count += 1
+            await session.execute(decay_stmt)
+            archived = cast(CursorResult[Any], await session.execute(archive_stmt))
             await session.commit()
 
-        return archived_count
+        return int(archived.rowcount)
 
     async def decay_semantic_confidence(self, weekly_decay: float = 0.05) -> int:
         """Decay semantic confidence for all records."""
 
-        updated = 0
-        stmt: Select[tuple[SemanticMemoryORM]] = select(SemanticMemoryORM)
+        stmt = (
+            update(SemanticMemoryORM)
+            .values(
+                confidence=func.greatest(
+                    0.0,
+                    func.round(sql_cast(SemanticMemoryORM.confidence - weekly_decay, Numeric), 3),
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
         async with self._database.session() as session:
-            rows = (await session.execute(stmt)).scalars().all()
-            for row in rows:
-                row.confidence = max(0.0, round(row.confidence - weekly_decay, 3))
-                updated += 1
+            result = cast(CursorResult[Any], await session.execute(stmt))
             await session.commit()
-        return updated
+        return int(result.rowcount)
 
     async def flag_dormant_goals(self, days_without_progress: int = 14) -> int:
         """Mark goals as dormant when stale."""
 
         cutoff = datetime.utcnow() - timedelta(days=days_without_progress)
-        updated = 0
-
-        stmt: Select[tuple[GoalORM]] = select(GoalORM).where(GoalORM.status == "active")
+        stmt = (
+            update(GoalORM)
+            .where(GoalORM.status == "active")
+            .where(or_(GoalORM.last_progressed.is_(None), GoalORM.last_progressed < cutoff))
+            .values(status="dormant")
+            .execution_options(synchronize_session=False)
+        )
         async with self._database.session() as session:
-            rows = (await session.execute(stmt)).scalars().all()
-            for row in rows:
-                stale = row.last_progressed is None or row.last_progressed < cutoff
-                if stale:
-                    row.status = "dormant"
-                    updated += 1
+            result = cast(CursorResult[Any], await session.execute(stmt))
             await session.commit()
 
-        return updated
+        return int(result.rowcount)
 
     async def record_llm_usage(
         self,
@@ -1,29 +1,64 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import random
+import sys
 import time
 from collections.abc import Awaitable
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, TypeVar, cast
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, cast
 from uuid import UUID
 
+import orjson
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
 from her.observability.logging import get_logger
+from her.observability.metrics import EVENT_COUNTER
+from her.utils.compat import async_timeout
 
+RECONNECT_BACKOFF_SECONDS = 5.0
+EVENT_BATCH_SIZE = 64
+EVENT_QUEUE_MAX_SIZE = 10_000
+EVENT_FLUSH_TIMEOUT_SECONDS = 5.0
+
+_last_message_ns = 0
 
-class WorkingMemory:
-    """Redis-backed session working memory with in-process fallback."""
 
-    def __init__(self, redis_url: str, ttl_minutes: int = 30, stream_name: str = "her:events") -> None:
+class WorkingMemory:
+    """Redis-backed session working memory with in-process fallback.
+
+    With ``redis_enabled=False`` the in-process store is used from the start
+    and no connection to Redis is ever attempted.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        ttl_minutes: int = 30,
+        stream_name: str = "her:events",
+        stream_max_length: int = 10000,
+        max_connections: int = 16,
+        health_check_interval: int = 30,
+        events_enabled: bool = True,
+        event_sample_rate: float = 1.0,
+        redis_enabled: bool = True,
+    ) -> None:
         self._redis_url = redis_url
-        self._ttl = timedelta(minutes=ttl_minutes)
-        self._ttl_seconds = int(self._ttl.total_seconds())
+        self._max_connections = max_connections
+        self._health_check_interval = health_check_interval
+        self._ttl_seconds = ttl_minutes * 60
         self._stream_name = stream_name
+        self._stream_max_length = stream_max_length
+        self._events_enabled = events_enabled
+        self._redis_enabled = redis_enabled
+        self._event_sample_rate = event_sample_rate
         self._client: Optional[Redis] = None
-        self._fallback_store: Dict[UUID, List[Dict[str, str]]] = {}
-        self._fallback_expires_at: Dict[UUID, datetime] = {}
+        self._reconnect_after = 0.0
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._fallback_sessions: Dict[UUID, Tuple[float, List[Dict[str, str]]]] = {}
+        self._events: Optional[asyncio.Queue[Dict[str, str]]] = None
+        self._event_writer: Optional[asyncio.Task[None]] = None
         self._logger = get_logger("working_memory")
 
     async def append(self, session_id: UUID, role: str, content: str) -> None:
@@ -35,49 +70,113 @@ class WorkingMemory:
             return
 
         key = _session_key(session_id)
-        field = str(time.time_ns())
-        payload = json.dumps({"role": role, "content": content})
+        field = _message_field()
+        payload = orjson.dumps({"role": role, "content": content})
 
-        await _await_maybe(client.hset(key, field, payload))
-        await _await_maybe(client.expire(key, self._ttl_seconds))
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, field, payload)
+            pipe.expire(key, self._ttl_seconds)
+            await pipe.execute()
 
     async def get(self, session_id: UUID) -> List[Dict[str, str]]:
         """Return session messages ordered by append time."""
 
         client = await self._get_client()
         if client is None:
-            self._cleanup_fallback(session_id)
-            return list(self._fallback_store.get(session_id, []))
+            return list(self._fallback_messages(session_id))
 
         key = _session_key(session_id)
-        raw = await _await_maybe(client.hgetall(key))
-        if not raw:
-            return []
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(key)
+            pipe.expire(key, self._ttl_seconds)
+            raw, _ = await pipe.execute()
+        return _decode_messages(raw)
 
-        items = sorted(raw.items(), key=lambda pair: int(pair[0]))
-        messages: List[Dict[str, str]] = []
-        for _, payload in items:
-            decoded = json.loads(payload)
-            role = str(decoded.get("role", "assistant"))
-            content = str(decoded.get("content", ""))
-            messages.append({"role": role, "content": content})
+    async def append_and_get(self, session_id: UUID, role: str, content: str) -> List[Dict[str, str]]:
+        """Append a message and return the session history in one round-trip."""
 
-        await _await_maybe(client.expire(key, self._ttl_seconds))
-        return messages
+        client = await self._get_client()
+        if client is None:
+            self._append_fallback(session_id=session_id, role=role, content=content)
+            return list(self._fallback_messages(session_id))
+
+        key = _session_key(session_id)
+        field = _message_field()
+        payload = orjson.dumps({"role": role, "content": content})
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, field, payload)
+            pipe.expire(key, self._ttl_seconds)
+            pipe.hgetall(key)
+            _, _, raw = await pipe.execute()
+        return _decode_messages(raw)
 
     async def emit_event(self, event_type: str, payload: Dict[str, str]) -> None:
-        """Emit a memory-related event to Redis Streams."""
+        """Queue a memory-related event for Redis Streams.
 
-        client = await self._get_client()
-        if client is None:
+        Events are written by a background task that pipelines them in
+        batches, so callers never wait on a Redis round-trip. Nothing is queued
+        when the event stream or Redis is disabled. Every event is counted in the
+        ``her_events_total`` metric, but only the ``event_sample_rate`` share of
+        them is written to the stream.
+        """
+
+        if not self._events_enabled or not self._redis_enabled:
             return
+        EVENT_COUNTER.labels(event_type=event_type).inc()
+        if self._event_sample_rate < 1.0 and random.random() >= self._event_sample_rate:
+            return
+        if self._events is None:
+            self._events = asyncio.Queue(maxsize=EVENT_QUEUE_MAX_SIZE)
+        if self._event_writer is None or self._event_writer.done():
+            self._event_writer = asyncio.create_task(self._write_events(self._events))
+        try:
+            self._events.put_nowait({"event": event_type, **payload})
+        except asyncio.QueueFull:
+            self._logger.warning("working_memory_event_dropped", event_type=event_type)
 
-        event_payload: Dict[str, str] = {"event": event_type, **payload}
-        await _await_maybe(client.xadd(self._stream_name, cast(Dict[Any, Any], event_payload)))
+    async def flush_events(self) -> None:
+        """Wait until every queued event has been handled by the writer."""
+
+        if self._events is not None and self._event_writer is not None:
+            await self._events.join()
+
+    @property
+    def redis_enabled(self) -> bool:
+        """Whether this working memory uses Redis at all."""
+
+        return self._redis_enabled
+
+    async def healthcheck(self) -> bool:
+        """Return whether Redis answers a ping."""
+
+        client = await self._get_client()
+        if client is None:
+            return False
+        try:
+            await _await_maybe(client.ping())
+            return True
+        except (RedisError, OSError):
+            return False
 
     async def close(self) -> None:
-        """Close underlying Redis connection if initialized."""
+        """Flush queued events and close underlying Redis connection if initialized.
+
+        The flush is bounded by ``EVENT_FLUSH_TIMEOUT_SECONDS`` so an
+        unresponsive Redis cannot hold up shutdown; unwritten events are dropped.
+        """
 
+        try:
+            async with async_timeout(EVENT_FLUSH_TIMEOUT_SECONDS):
+                await self.flush_events()
+        except asyncio.TimeoutError:
+            pending = self._events.qsize() if self._events is not None else 0
+            self._logger.warning("working_memory_event_flush_timed_out", pending=pending)
+        if self._event_writer is not None:
+            self._event_writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._event_writer
+            self._event_writer = None
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -85,27 +184,77 @@ class WorkingMemory:
     async def _get_client(self) -> Optional[Redis]:
         if self._client is not None:
             return self._client
+        if not self._redis_enabled or time.monotonic() < self._reconnect_after:
+            return None
 
+        # Concurrent first callers share one connection attempt rather than
+        # each building (and leaking) a pool of their own.
+        async with self._lock():
+            if self._client is None and time.monotonic() >= self._reconnect_after:
+                self._client = await self._connect()
+            return self._client
+
+    def _lock(self) -> asyncio.Lock:
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        return self._connect_lock
+
+    async def _connect(self) -> Optional[Redis]:
+        client = Redis.from_url(
+            self._redis_url,
+            decode_responses=True,
+            max_connections=self._max_connections,
+            socket_keepalive=True,
+            health_check_interval=self._health_check_interval,
+        )
         try:
-            client = Redis.from_url(self._redis_url, decode_responses=True)
             await _await_maybe(client.ping())
-            self._client = client
-            self._logger.info("working_memory_redis_connected", redis_url=self._redis_url)
-            return self._client
         except (RedisError, OSError) as exc:
+            await client.aclose()
+            self._reconnect_after = time.monotonic() + RECONNECT_BACKOFF_SECONDS
             self._logger.warning("working_memory_redis_unavailable", error=str(exc))
             return None
 
+        self._logger.info("working_memory_redis_connected", redis_url=self._redis_url)
+        return client
+
+    async def _write_events(self, events: asyncio.Queue[Dict[str, str]]) -> None:
+        while True:
+            batch = [await events.get()]
+            while len(batch) < EVENT_BATCH_SIZE and not events.empty():
+                batch.append(events.get_nowait())
+            try:
+                client = await self._get_client()
+                if client is not None:
+                    async with client.pipeline(transaction=False) as pipe:
+                        for event in batch:
+                            pipe.xadd(
+                                self._stream_name,
+                                cast(Dict[Any, Any], event),
+                                maxlen=self._stream_max_length,
+                                approximate=True,
+                            )
+                        await pipe.execute()
+            except (RedisError, OSError) as exc:
+                self._logger.warning("working_memory_event_write_failed", events=len(batch), error=str(exc))
+            finally:
+                for _ in batch:
+                    events.task_done()
+
     def _append_fallback(self, session_id: UUID, role: str, content: str) -> None:
-        self._cleanup_fallback(session_id)
-        self._fallback_store.setdefault(session_id, []).append({"role": role, "content": content})
-        self._fallback_expires_at[session_id] = datetime.utcnow() + self._ttl
+        messages = self._fallback_messages(session_id)
+        messages.append({"role": role, "content": content})
+        self._fallback_sessions[session_id] = (time.monotonic() + self._ttl_seconds, messages)
 
-    def _cleanup_fallback(self, session_id: UUID) -> None:
-        expires = self._fallback_expires_at.get(session_id)
-        if expires and datetime.utcnow() > expires:
-            self._fallback_store.pop(session_id, None)
-            self._fallback_expires_at.pop(session_id, None)
+    def _fallback_messages(self, session_id: UUID) -> List[Dict[str, str]]:
+        entry = self._fallback_sessions.get(session_id)
+        if entry is None:
+            return []
+        expires_at, messages = entry
+        if time.monotonic() > expires_at:
+            del self._fallback_sessions[session_id]
+            return []
+        return messages
 
 
 
@@ -113,6 +262,30 @@ def _session_key(session_id: UUID) -> str:
     return f"her:wm:{session_id}"
 
 
+def _message_field() -> str:
+    # Fields both order a session's messages and key them in the hash, so two
+    # appends within one clock tick must not share a field and overwrite.
+    global _last_message_ns
+    _last_message_ns = max(time.time_ns(), _last_message_ns + 1)
+    return str(_last_message_ns)
+
+
+def _decode_messages(raw: Dict[str, str]) -> List[Dict[str, str]]:
+    if not raw:
+        return []
+
+    items = sorted(raw.items(), key=lambda pair: int(pair[0]))
+    messages: List[Dict[str, str]] = []
+    for _, payload in items:
+        decoded = orjson.loads(payload)
+        # Roles repeat across every message, so share one string per role.
+        role = sys.intern(str(decoded.get("role", "assistant")))
+        content = str(decoded.get("content", ""))
+        messages.append({"role": role, "content": content})
+
+    return messages
+
+
 T = TypeVar("T")
 
 
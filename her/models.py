@@ -6,6 +6,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+MAX_CHAT_CONTENT_CHARS = 16_000
+
 
 class PersonalityVector(BaseModel):
     curiosity: float = Field(ge=0.1, le=0.95)
@@ -57,7 +59,7 @@ class LLMResponse(BaseModel):
 
 
 class ChatRequest(BaseModel):
-    content: str
+    content: str = Field(max_length=MAX_CHAT_CONTENT_CHARS)
     session_id: UUID
 
 
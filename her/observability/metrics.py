@@ -27,6 +27,12 @@ PROVIDER_COST_USD = Counter(
     labelnames=("provider",),
 )
 
+EVENT_COUNTER = Counter(
+    "her_events_total",
+    "Interaction events emitted, including those not sampled into the event stream",
+    labelnames=("event_type",),
+)
+
 
 def record_provider_call(provider: str, success: bool, latency_ms: int, cost_usd: float) -> None:
     """Record a provider invocation with status, latency, and cost."""
@@ -4,19 +4,22 @@ from her.personality.emotional_overlay import (
     decay_emotional_state,
     infer_emotional_state,
 )
-from her.personality.manager import PersonalityManager
+from her.personality.manager import PersonalityManager, build_personality_manager
 from her.personality.prompt_builder import build_system_prompt
 from her.personality.vector import (
+    DEFAULT_BASELINE_PATH,
     load_drift_config,
     load_emotional_baseline,
     load_personality_baseline,
 )
 
 __all__ = [
+    "DEFAULT_BASELINE_PATH",
     "DriftConfig",
     "DriftEngine",
     "PersonalityManager",
     "apply_emotional_overlay",
+    "build_personality_manager",
     "build_system_prompt",
     "decay_emotional_state",
     "infer_emotional_state",
@@ -20,26 +20,28 @@ class DriftEngine:
 
     def __init__(self, baseline: PersonalityVector, config: DriftConfig | None = None) -> None:
         self._baseline = baseline
+        self._baseline_map: Dict[str, float] = baseline.model_dump()
         self._config = config or DriftConfig()
-        self._weekly_accumulator: Dict[str, float] = {k: 0.0 for k in baseline.model_dump().keys()}
+        self._weekly_accumulator: Dict[str, float] = {k: 0.0 for k in self._baseline_map}
 
     def apply_feedback(self, current: PersonalityVector, deltas: Dict[str, float]) -> PersonalityVector:
         """Apply bounded deltas and return updated personality vector."""
 
-        current_map = current.model_dump()
+        config = self._config
+        accumulator = self._weekly_accumulator
         next_map: Dict[str, float] = {}
 
-        for trait, value in current_map.items():
+        for trait, value in current.model_dump().items():
             delta = deltas.get(trait, 0.0)
-            delta = max(-self._config.max_single_delta, min(self._config.max_single_delta, delta))
+            delta = max(-config.max_single_delta, min(config.max_single_delta, delta))
 
-            weekly = self._weekly_accumulator[trait] + delta
-            weekly = max(-self._config.max_weekly_drift, min(self._config.max_weekly_drift, weekly))
-            delta = weekly - self._weekly_accumulator[trait]
-            self._weekly_accumulator[trait] = weekly
+            previous = accumulator[trait]
+            weekly = max(-config.max_weekly_drift, min(config.max_weekly_drift, previous + delta))
+            delta = weekly - previous
+            accumulator[trait] = weekly
 
             proposed = value + delta
-            bounded = max(self._config.lower_bound, min(self._config.upper_bound, proposed))
+            bounded = max(config.lower_bound, min(config.upper_bound, proposed))
             next_map[trait] = round(bounded, 4)
 
         return PersonalityVector(**next_map)
@@ -47,16 +49,15 @@ class DriftEngine:
     def weekly_regress(self, current: PersonalityVector) -> PersonalityVector:
         """Pull personality toward baseline and decay weekly accumulator."""
 
-        current_map = current.model_dump()
-        base_map = self._baseline.model_dump()
+        config = self._config
+        base_map = self._baseline_map
         next_map: Dict[str, float] = {}
 
-        for trait, value in current_map.items():
-            baseline_value = base_map[trait]
-            adjustment = (baseline_value - value) * self._config.regression_rate
+        for trait, value in current.model_dump().items():
+            adjustment = (base_map[trait] - value) * config.regression_rate
             moved = value + adjustment
-            bounded = max(self._config.lower_bound, min(self._config.upper_bound, moved))
+            bounded = max(config.lower_bound, min(config.upper_bound, moved))
             next_map[trait] = round(bounded, 4)
-            self._weekly_accumulator[trait] *= 1 - self._config.regression_rate
+            self._weekly_accumulator[trait] *= 1 - config.regression_rate
 
         return PersonalityVector(**next_map)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Dict, Literal, Mapping
 
@@ -43,6 +44,9 @@ NEGATIVE_TOKENS = {
     "sad",
     "stressed",
 }
+PLAYFUL_TOKENS = {"joke", "fun", "haha", "lol"}
+
+_WORD_RE = re.compile(r"[^\W_]+")
 
 
 def infer_emotional_state(text: str, current: EmotionalState) -> EmotionalState:
@@ -63,7 +67,7 @@ def infer_emotional_state(text: str, current: EmotionalState) -> EmotionalState:
         next_state = "warm"
     elif engagement > 0.7:
         next_state = "reflective"
-    elif any(word in {"joke", "fun", "haha", "lol"} for word in words):
+    elif not PLAYFUL_TOKENS.isdisjoint(words):
         next_state = "playful"
     else:
         next_state = "calm"
@@ -115,6 +119,4 @@ def apply_emotional_overlay(personality: PersonalityVector, emotional_state: Emo
 
 
 def _tokenize(text: str) -> list[str]:
-    normalized = text.lower()
-    cleaned = "".join(ch if ch.isalnum() or ch.isspace() else " " for ch in normalized)
-    return [token for token in cleaned.split() if token]
+    return _WORD_RE.findall(text.lower())
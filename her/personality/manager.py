@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, Literal, Optional, Protocol, cast
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional, Protocol, Tuple, cast
 
 from her.models import EmotionalState, PersonalityVector
 from her.memory.types import PersonalitySnapshotRecord
+from her.observability.logging import get_logger
 from her.personality.drift_engine import DriftEngine
 from her.personality.emotional_overlay import (
     apply_emotional_overlay,
@@ -12,6 +14,12 @@ from her.personality.emotional_overlay import (
     infer_emotional_state,
 )
 from her.personality.prompt_builder import build_system_prompt
+from her.personality.vector import (
+    DEFAULT_BASELINE_PATH,
+    load_drift_config,
+    load_emotional_baseline,
+    load_personality_baseline,
+)
 
 
 class PersonalitySnapshotStore(Protocol):
@@ -41,7 +49,10 @@ class PersonalityManager:
         self._emotion = baseline_emotion
         self._drift_engine = drift_engine
         self._snapshot_store = snapshot_store
+        self._last_snapshot_state: Optional[Tuple[Any, ...]] = None
+        self._snapshot_tail: Optional[asyncio.Task[None]] = None
         self._lock = asyncio.Lock()
+        self._logger = get_logger("personality_manager")
 
     @property
     def current_personality(self) -> PersonalityVector:
@@ -102,6 +113,12 @@ class PersonalityManager:
                 ),
             )
 
+    async def flush(self) -> None:
+        """Wait for snapshot writes scheduled in the background to finish."""
+
+        while self._snapshot_tail is not None and not self._snapshot_tail.done():
+            await asyncio.wait({self._snapshot_tail})
+
     async def _snapshot(self, trigger: str, deltas: Dict[str, float]) -> None:
         if self._snapshot_store is None:
             return
@@ -112,25 +129,68 @@ class PersonalityManager:
             "decay_rate": self._emotion.decay_rate,
             "triggered_by": self._emotion.triggered_by,
         }
-        await self._snapshot_store.create_personality_snapshot(
-            traits=self._personality.model_dump(),
-            emotional_baseline=emotional_payload,
-            drift_delta=deltas,
-            trigger_summary=trigger,
+        traits = self._personality.model_dump()
+        state = (tuple(traits.values()), tuple(emotional_payload.values()))
+        if state == self._last_snapshot_state:
+            return
+
+        self._last_snapshot_state = state
+        # Each write waits for the one scheduled before it, so snapshots commit in
+        # the order the state changed and the latest row is always the newest state.
+        self._snapshot_tail = asyncio.create_task(
+            self._write_snapshot(
+                self._snapshot_tail, self._snapshot_store, traits, emotional_payload, deltas, trigger
+            )
         )
 
+    async def _write_snapshot(
+        self,
+        previous: Optional[asyncio.Task[None]],
+        store: PersonalitySnapshotStore,
+        traits: Dict[str, float],
+        emotional_payload: Dict[str, float | str | None],
+        deltas: Dict[str, float],
+        trigger: str,
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait({previous})
+        try:
+            await store.create_personality_snapshot(
+                traits=traits,
+                emotional_baseline=emotional_payload,
+                drift_delta=deltas,
+                trigger_summary=trigger,
+            )
+        except Exception as exc:
+            self._last_snapshot_state = None
+            self._logger.warning("personality_snapshot_failed", trigger=trigger, error=str(exc))
+
+
+def build_personality_manager(
+    config_path: Path = DEFAULT_BASELINE_PATH,
+    snapshot_store: Optional[PersonalitySnapshotStore] = None,
+) -> PersonalityManager:
+    """Build a personality manager from the baseline YAML."""
+
+    baseline = load_personality_baseline(config_path)
+    return PersonalityManager(
+        baseline_personality=baseline,
+        baseline_emotion=load_emotional_baseline(config_path),
+        drift_engine=DriftEngine(baseline, config=load_drift_config(config_path)),
+        snapshot_store=snapshot_store,
+    )
+
+
+_STATE_SENTIMENT: Dict[str, float] = {"warm": 0.7, "tense": -0.7}
+_CHALLENGE_TOKENS = {"why", "prove", "evidence", "sure"}
+
 
 def _interaction_deltas(content: str, emotion: EmotionalState) -> Dict[str, float]:
-    words = [token for token in content.lower().split() if token]
+    words = content.lower().split()
     engagement = min(1.0, len(words) / 28.0)
     question_weight = min(1.0, content.count("?") / 3.0)
-    contains_challenge = any(token in {"why", "prove", "evidence", "sure"} for token in words)
-
-    sentiment = 0.0
-    if emotion.state == "warm":
-        sentiment = 0.7
-    elif emotion.state == "tense":
-        sentiment = -0.7
+    contains_challenge = not _CHALLENGE_TOKENS.isdisjoint(words)
+    sentiment = _STATE_SENTIMENT.get(emotion.state, 0.0)
 
     return {
         "curiosity": round(0.012 * engagement + 0.01 * question_weight, 4),
@@ -1,34 +1,65 @@
 from __future__ import annotations
 
+import copy
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import yaml  # type: ignore[import-untyped]
 
 from her.models import EmotionalState, PersonalityVector
 from her.personality.drift_engine import DriftConfig
 
+# The LibYAML loader exists only when PyYAML was built against libyaml.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parents[1] / "config" / "personality_baseline.yaml"
+YAML_CACHE_MAX_ENTRIES = 100
+
+# Parsed YAML keyed by resolved path and validated against (mtime_ns, size),
+# so an edited file is re-read while repeated loads skip the parse.
+_YAML_CACHE: "OrderedDict[Path, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+
 
 def load_personality_baseline(config_path: Path) -> PersonalityVector:
     """Load the personality baseline vector from YAML."""
 
-    with config_path.open("r", encoding="utf-8") as handle:
-        payload: Dict[str, Any] = yaml.safe_load(handle)
+    payload = _load_yaml(config_path)
     return PersonalityVector(**payload["traits"])
 
 
 def load_emotional_baseline(config_path: Path) -> EmotionalState:
     """Load emotional baseline state from YAML."""
 
-    with config_path.open("r", encoding="utf-8") as handle:
-        payload: Dict[str, Any] = yaml.safe_load(handle)
+    payload = _load_yaml(config_path)
     return EmotionalState(**payload["emotion"])
 
 
 def load_drift_config(config_path: Path) -> DriftConfig:
     """Load drift configuration from personality baseline YAML."""
 
-    with config_path.open("r", encoding="utf-8") as handle:
-        payload: Dict[str, Any] = yaml.safe_load(handle)
+    payload = _load_yaml(config_path)
     drift_limits = payload.get("drift_limits", {})
     return DriftConfig(**drift_limits)
+
+
+def _load_yaml(config_path: Path) -> Dict[str, Any]:
+    """Return a private copy of the parsed YAML so callers may mutate it."""
+
+    return copy.deepcopy(_parse_yaml(config_path.resolve()))
+
+
+def _parse_yaml(resolved_path: Path) -> Dict[str, Any]:
+    stat = resolved_path.stat()
+    cached = _YAML_CACHE.get(resolved_path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _YAML_CACHE.move_to_end(resolved_path)
+        return cached[2]
+
+    # LibYAML scans the raw bytes itself, so no str decode pass is needed;
+    # an empty document loads as None and is treated as an empty mapping.
+    payload: Dict[str, Any] = yaml.load(resolved_path.read_bytes(), Loader=_SafeLoader) or {}
+    _YAML_CACHE[resolved_path] = (stat.st_mtime_ns, stat.st_size, payload)
+    _YAML_CACHE.move_to_end(resolved_path)
+    if len(_YAML_CACHE) > YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+    return payload
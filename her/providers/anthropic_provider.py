@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 
 import httpx
+import orjson
 
 from her.config.settings import Settings
 from her.models import LLMRequest, LLMResponse
@@ -20,8 +21,12 @@ class AnthropicProvider(LLMProvider):
 
     name = "anthropic"
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, http_client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._http_client = http_client
+
+    def is_configured(self) -> bool:
+        return bool(self._settings.anthropic_api_key)
 
     async def generate(self, request: LLMRequest) -> LLMResponse:
         if not self._settings.anthropic_api_key:
@@ -43,8 +48,12 @@ class AnthropicProvider(LLMProvider):
 
         started = time.perf_counter()
         try:
-            async with httpx.AsyncClient(timeout=self._settings.request_timeout_seconds) as client:
-                response = await client.post(url, json=payload, headers=headers)
+            response = await self._http_client.post(
+                url,
+                content=orjson.dumps(payload),
+                headers=headers,
+                timeout=self._settings.request_timeout_seconds,
+            )
         except httpx.TimeoutException as exc:
             raise ProviderTimeoutError("Anthropic request timed out") from exc
 
@@ -57,7 +66,7 @@ class AnthropicProvider(LLMProvider):
             raise ProviderServerError(f"Anthropic server error: {response.status_code}")
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         usage = data.get("usage", {})
         prompt_tokens = int(usage.get("input_tokens", 0))
         completion_tokens = int(usage.get("output_tokens", 0))
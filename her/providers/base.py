@@ -10,6 +10,11 @@ class LLMProvider(ABC):
 
     name: str
 
+    def is_configured(self) -> bool:
+        """Return whether the settings this provider needs are present."""
+
+        return True
+
     @abstractmethod
     async def generate(self, request: LLMRequest) -> LLMResponse:
         """Generate a completion for the request."""
@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 
 import httpx
+import orjson
 
 from her.config.settings import Settings
 from her.models import LLMRequest, LLMResponse
@@ -20,8 +21,12 @@ class CustomProvider(LLMProvider):
 
     name = "custom"
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, http_client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._http_client = http_client
+
+    def is_configured(self) -> bool:
+        return bool(self._settings.custom_llm_endpoint)
 
     async def generate(self, request: LLMRequest) -> LLMResponse:
         if not self._settings.custom_llm_endpoint:
@@ -40,8 +45,12 @@ class CustomProvider(LLMProvider):
 
         started = time.perf_counter()
         try:
-            async with httpx.AsyncClient(timeout=self._settings.request_timeout_seconds) as client:
-                response = await client.post(self._settings.custom_llm_endpoint, json=payload, headers=headers)
+            response = await self._http_client.post(
+                self._settings.custom_llm_endpoint,
+                content=orjson.dumps(payload),
+                headers=headers,
+                timeout=self._settings.request_timeout_seconds,
+            )
         except httpx.TimeoutException as exc:
             raise ProviderTimeoutError("Custom LLM request timed out") from exc
 
@@ -54,7 +63,7 @@ class CustomProvider(LLMProvider):
             raise ProviderServerError(f"Custom provider server error: {response.status_code}")
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         usage = data.get("usage", {})
         prompt_tokens = int(usage.get("prompt_tokens", 0))
         completion_tokens = int(usage.get("completion_tokens", 0))
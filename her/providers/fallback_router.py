@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, Iterable
+from typing import Dict, Iterable, List
 from uuid import UUID
 
 from her.models import LLMRequest, LLMResponse
@@ -15,6 +15,7 @@ from her.providers.errors import (
     ProviderServerError,
     ProviderTimeoutError,
 )
+from her.utils.compat import async_timeout
 
 
 RECOVERABLE_ERRORS = (
@@ -31,15 +32,22 @@ class FallbackRouter(LLMProvider):
     name = "router"
 
     def __init__(self, providers: Iterable[LLMProvider], timeout_seconds: float = 30.0) -> None:
-        self._providers = list(providers)
         self._timeout_seconds = timeout_seconds
         self._cache: Dict[UUID, LLMResponse] = {}
         self._logger = get_logger("fallback_router")
+        # Resolve missing credentials once here instead of failing on every request.
+        self._providers: List[LLMProvider] = []
+        for provider in providers:
+            if provider.is_configured():
+                self._providers.append(provider)
+            else:
+                self._logger.warning("provider_not_configured", provider=provider.name)
 
     async def generate(self, request: LLMRequest) -> LLMResponse:
         for provider in self._providers:
             try:
-                response = await asyncio.wait_for(provider.generate(request), timeout=self._timeout_seconds)
+                async with async_timeout(self._timeout_seconds):
+                    response = await provider.generate(request)
                 self._cache[request.session_id] = response
                 record_provider_call(provider=provider.name, success=True, latency_ms=response.latency_ms, cost_usd=response.cost_usd)
                 self._logger.info("provider_success", provider=provider.name, trace_id=request.trace_id)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import httpx
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 64
+
+
+def create_provider_http_client(
+    max_connections: int = MAX_CONNECTIONS,
+    max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+) -> httpx.AsyncClient:
+    """Build the pooled HTTP client shared by LLM and embedding providers.
+
+    Providers pass their own timeout per request, so one client serves every
+    provider and keeps connections to each upstream alive between calls.
+    Keep-alive slots should cover the expected concurrent provider calls;
+    connections beyond them are closed after each request. The caller owns the
+    client and closes it on shutdown.
+    """
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+    )
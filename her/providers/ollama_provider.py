@@ -3,20 +3,24 @@ from __future__ import annotations
 import time
 
 import httpx
+import orjson
 
 from her.config.settings import Settings
 from her.models import LLMRequest, LLMResponse
 from her.providers.base import LLMProvider, estimate_cost
 from her.providers.errors import ProviderServerError, ProviderTimeoutError
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OllamaProvider(LLMProvider):
     """Ollama local provider implementation."""
 
     name = "ollama"
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, http_client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._http_client = http_client
 
     async def generate(self, request: LLMRequest) -> LLMResponse:
         url = f"{self._settings.ollama_base_url.rstrip('/')}/api/chat"
@@ -31,8 +35,12 @@ class OllamaProvider(LLMProvider):
 
         started = time.perf_counter()
         try:
-            async with httpx.AsyncClient(timeout=self._settings.request_timeout_seconds) as client:
-                response = await client.post(url, json=payload)
+            response = await self._http_client.post(
+                url,
+                content=orjson.dumps(payload),
+                headers=JSON_HEADERS,
+                timeout=self._settings.request_timeout_seconds,
+            )
         except httpx.TimeoutException as exc:
             raise ProviderTimeoutError("Ollama request timed out") from exc
 
@@ -41,7 +49,7 @@ class OllamaProvider(LLMProvider):
             raise ProviderServerError(f"Ollama server error: {response.status_code}")
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         content = data.get("message", {}).get("content", "").strip()
         prompt_tokens = len(request.system_prompt.split()) + sum(len(m.get("content", "").split()) for m in request.messages)
         completion_tokens = len(content.split())
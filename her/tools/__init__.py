@@ -1,5 +1,11 @@
 from her.tools.registry import Tool, ToolRegistry
 from her.tools.sandbox import run_sandboxed_command
-from her.tools.web_research import fetch_url_text
+from her.tools.web_research import create_web_research_client, fetch_url_text
 
-__all__ = ["Tool", "ToolRegistry", "run_sandboxed_command", "fetch_url_text"]
+__all__ = [
+    "Tool",
+    "ToolRegistry",
+    "create_web_research_client",
+    "fetch_url_text",
+    "run_sandboxed_command",
+]
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Dict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 
 ToolHandler = Callable[..., Awaitable[str]]
+ToolDescriptor = Dict[str, Any]
 
 
 @dataclass
@@ -12,6 +13,7 @@ class Tool:
     name: str
     handler: ToolHandler
     requires_approval: bool
+    description: str = ""
 
 
 class ToolRegistry:
@@ -19,11 +21,31 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: Dict[str, Tool] = {}
+        self._descriptors: Optional[Tuple[ToolDescriptor, ...]] = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool by name."""
 
         self._tools[tool.name] = tool
+        self._descriptors = None
+
+    def list_tools(self) -> Tuple[ToolDescriptor, ...]:
+        """Return descriptors for every registered tool.
+
+        The listing is built once and reused until the registry changes, so
+        callers must treat the returned descriptors as read-only.
+        """
+
+        if self._descriptors is None:
+            self._descriptors = tuple(
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "requires_approval": tool.requires_approval,
+                }
+                for tool in self._tools.values()
+            )
+        return self._descriptors
 
     async def invoke(self, tool_name: str, **kwargs: str) -> str:
         """Invoke a registered tool."""
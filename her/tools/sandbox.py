@@ -1,22 +1,90 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Sequence
+import os
+import shutil
+import weakref
+from functools import lru_cache
+from typing import Mapping, Optional, Sequence, Union
 
+from her.utils.compat import async_timeout
 
-async def run_sandboxed_command(command: Sequence[str], timeout_seconds: int = 10) -> str:
-    """Execute a command without shell expansion and return output."""
+MAX_PARALLEL_COMMANDS = 8
+STDIN_WRITE_BUFFER_HIGH_BYTES = 1024 * 1024
+STDIN_WRITE_BUFFER_LOW_BYTES = 256 * 1024
 
-    process = await asyncio.create_subprocess_exec(
-        *command,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.STDOUT,
-    )
-    try:
-        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout_seconds)
-    except asyncio.TimeoutError:
-        process.kill()
-        await process.wait()
-        raise TimeoutError("Sandboxed command timed out")
+_command_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def run_sandboxed_command(
+    command: Sequence[str],
+    timeout_seconds: float = 10,
+    env: Optional[Mapping[str, str]] = None,
+    stdin: Optional[Union[bytes, str]] = None,
+) -> str:
+    """Execute a command without shell expansion and return output.
+
+    The child inherits this process's environment as-is; ``env`` overrides are
+    merged on top in a single step only when given. At most
+    ``MAX_PARALLEL_COMMANDS`` commands run at once per event loop; further
+    calls wait for a slot before their timeout starts. ``stdin`` is piped to the
+    command, so scripts can run as e.g. ``["python3", "-"]`` or
+    ``["sh", "-s"]`` without a temp file or setting its execute bit, and
+    payloads are not bounded by the argument-size limit; text is encoded as
+    UTF-8. Without it the command reads from /dev/null.
+    """
+
+    if isinstance(stdin, str):
+        stdin = stdin.encode("utf-8")
+
+    executable = _resolve_executable(command[0], os.environ.get("PATH"))
+    if executable is None:
+        raise FileNotFoundError(f"Sandboxed command not found: {command[0]}")
+
+    async with _command_slot():
+        process = await asyncio.create_subprocess_exec(
+            executable,
+            *command[1:],
+            stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env={**os.environ, **env} if env else None,
+        )
+        if stdin is not None:
+            _raise_stdin_buffer_limits(process)
+        try:
+            async with async_timeout(timeout_seconds):
+                stdout, _ = await process.communicate(stdin)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise TimeoutError("Sandboxed command timed out")
 
     return stdout.decode("utf-8", errors="replace")
+
+
+def _command_slot() -> asyncio.Semaphore:
+    # One semaphore per loop, since asyncio primitives must not be shared
+    # across event loops.
+    loop = asyncio.get_running_loop()
+    slots = _command_slots.get(loop)
+    if slots is None:
+        slots = _command_slots[loop] = asyncio.Semaphore(MAX_PARALLEL_COMMANDS)
+    return slots
+
+
+def _raise_stdin_buffer_limits(process: asyncio.subprocess.Process) -> None:
+    # Large payloads (scripts, code blocks) then drain in a few wakeups instead
+    # of one per 64 KiB accepted by the pipe.
+    if process.stdin is not None:
+        process.stdin.transport.set_write_buffer_limits(
+            high=STDIN_WRITE_BUFFER_HIGH_BYTES, low=STDIN_WRITE_BUFFER_LOW_BYTES
+        )
+
+
+@lru_cache(maxsize=64)
+def _resolve_executable(command: str, search_path: Optional[str]) -> Optional[str]:
+    # PATH is part of the key so a changed environment resolves afresh.
+    return shutil.which(command, path=search_path)
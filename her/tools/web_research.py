@@ -1,12 +1,44 @@
 from __future__ import annotations
 
+from typing import Mapping, Optional
+
 import httpx
 
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+
+def create_web_research_client() -> httpx.AsyncClient:
+    """Build the pooled HTTP client used for research fetches.
+
+    The caller owns the client and closes it on shutdown.
+    """
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
+
+async def fetch_url_text(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout_seconds: float = 10.0,
+    params: Optional[Mapping[str, str]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> str:
+    """Fetch page text for lightweight research tasks.
 
-async def fetch_url_text(url: str, timeout_seconds: float = 10.0) -> str:
-    """Fetch page text for lightweight research tasks."""
+    Query parameters and headers are passed as mappings and encoded by the
+    HTTP client, so callers never splice values into the URL themselves.
+    Redirects are not followed, since a fetched page could otherwise send the
+    request on to an internal address. A redirect raises
+    ``httpx.HTTPStatusError`` whose response carries the ``Location`` header,
+    so the caller decides whether the target is safe to fetch.
+    """
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-        response = await client.get(url)
+    response = await client.get(url, params=params, headers=headers, timeout=timeout_seconds)
     response.raise_for_status()
     return response.text
@@ -0,0 +1,3 @@
+from her.utils.compat import async_timeout
+
+__all__ = ["async_timeout"]
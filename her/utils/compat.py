@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import sys
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:  # pragma: no cover - exercised on Python < 3.11 only
+    from async_timeout import timeout as async_timeout  # type: ignore[import-not-found]
+
+__all__ = ["async_timeout"]
@@ -7,4 +7,13 @@ from her.config.settings import get_settings
 
 if __name__ == "__main__":
     settings = get_settings()
-    uvicorn.run("her.interfaces.api.main:app", host=settings.api_host, port=settings.api_port, reload=False)
+    uvicorn.run(
+        "her.interfaces.api.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        reload=False,
+        loop="auto",
+        http="auto",
+        access_log=settings.api_access_log,
+        ws_max_size=settings.api_max_body_bytes,
+    )
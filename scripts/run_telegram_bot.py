@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import signal
 
 from her.config.settings import get_settings
 from her.interfaces.api.main import create_app
@@ -21,6 +22,11 @@ async def main() -> None:
             memory_store=app.state.memory_store,
             personality_manager=app.state.personality_manager,
         )
+        # Native polling only returns once stop() is called, so wire it to the
+        # usual shutdown signals to let the lifespan release its resources.
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, bot.stop)
         await bot.start()
 
 
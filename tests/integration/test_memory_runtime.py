@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from uuid import uuid4
 
 import pytest
@@ -57,3 +58,35 @@ async def test_memory_store_with_live_postgres_and_redis() -> None:
     await working_memory.close()
     await redis.aclose()
     await database.dispose()
+
+
+@pytest.mark.asyncio
+async def test_batch_reinforcement_merges_episodes_and_tags() -> None:
+    settings = Settings()
+
+    database = MemoryDatabase(settings.database_url)
+    if not await database.healthcheck():
+        await database.dispose()
+        pytest.skip("Postgres is not available for integration test")
+
+    store = MemoryStore(database)
+    concept = f"batch-merge-{uuid4()}"
+    first_episode, second_episode = uuid4(), uuid4()
+    original = await store.upsert_semantic_concept(
+        concept=concept, summary="first", episode_id=first_episode, tags=["a"]
+    )
+
+    update = replace(
+        original,
+        concept=concept.upper(),
+        summary="first second",
+        source_episode_ids=[second_episode],
+        tags=["a", "b"],
+    )
+    (reinforced,) = await store.reinforce_semantic_summaries([update])
+
+    assert reinforced.id == original.id
+    assert reinforced.summary == "first second"
+    assert reinforced.source_episode_ids == [first_episode, second_episode]
+    assert reinforced.tags == ["a", "b"]
+    await database.dispose()
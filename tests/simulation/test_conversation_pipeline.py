@@ -123,6 +123,10 @@ class FakeWorkingMemory:
     async def get(self, session_id) -> List[Dict[str, str]]:
         return list(self.messages.get(str(session_id), []))
 
+    async def append_and_get(self, session_id, role: str, content: str) -> List[Dict[str, str]]:
+        await self.append(session_id, role, content)
+        return await self.get(session_id)
+
     async def emit_event(self, event_type: str, payload: Dict[str, str]) -> None:
         event = {"event": event_type}
         event.update(payload)
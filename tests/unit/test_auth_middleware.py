@@ -0,0 +1,31 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from her.interfaces.api.middleware.auth import BearerAuthMiddleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/state")
+    async def state() -> dict[str, str]:
+        return {"state": "ok"}
+
+    app.add_middleware(BearerAuthMiddleware, token="secret")
+    return TestClient(app)
+
+
+def test_bearer_auth_rejects_missing_or_wrong_token() -> None:
+    client = _client()
+    assert client.get("/state").status_code == 401
+    assert client.get("/state", headers={"Authorization": "Bearer nope"}).status_code == 401
+
+
+def test_bearer_auth_accepts_token_and_public_paths() -> None:
+    client = _client()
+    assert client.get("/state", headers={"Authorization": "Bearer secret"}).status_code == 200
+    assert client.get("/health").status_code == 200
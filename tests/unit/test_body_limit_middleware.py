@@ -0,0 +1,64 @@
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from her.interfaces.api.middleware.body_limit import BodySizeLimitMiddleware
+from her.models import ChatRequest
+
+
+def _client(max_body_bytes: int = 16) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/echo")
+    async def echo(request: Request) -> dict[str, int]:
+        return {"size": len(await request.body())}
+
+    @app.post("/chat")
+    async def chat(payload: ChatRequest) -> dict[str, str]:
+        return {"content": payload.content}
+
+    app.add_middleware(BodySizeLimitMiddleware, max_body_bytes=max_body_bytes)
+    return TestClient(app)
+
+
+def test_body_limit_allows_small_bodies() -> None:
+    response = _client().post("/echo", content=b"x" * 16)
+    assert response.status_code == 200
+    assert response.json() == {"size": 16}
+
+
+def test_body_limit_rejects_large_declared_and_streamed_bodies() -> None:
+    client = _client()
+    assert client.post("/echo", content=b"x" * 17).status_code == 413
+
+    def chunks():
+        yield b"x" * 10
+        yield b"x" * 10
+
+    assert client.post("/echo", content=chunks()).status_code == 413
+
+
+def test_body_limit_rejects_streamed_body_before_model_validation() -> None:
+    client = _client(max_body_bytes=128)
+    body = b'{"session_id": "%s", "content": "%s"}' % (str(uuid4()).encode(), b"x" * 200)
+
+    def chunks():
+        yield body[:64]
+        yield body[64:]
+
+    response = client.post("/chat", content=chunks(), headers={"content-type": "application/json"})
+    assert response.status_code == 413
+
+
+def test_body_limit_passes_streamed_body_to_model_validation() -> None:
+    client = _client(max_body_bytes=128)
+    body = b'{"session_id": "%s", "content": "hi"}' % str(uuid4()).encode()
+
+    def chunks():
+        yield body[:20]
+        yield body[20:]
+
+    response = client.post("/chat", content=chunks(), headers={"content-type": "application/json"})
+    assert response.status_code == 200
+    assert response.json() == {"content": "hi"}
@@ -1,8 +1,13 @@
+from typing import List
+
+import httpx
+import pytest
+
 from her.config.settings import Settings
-from her.embeddings.base import normalize_dimensions
+from her.embeddings.base import EmbeddingProvider, normalize_dimensions
 from her.embeddings.custom_provider import CustomEmbeddingProvider
 from her.embeddings.ollama_provider import OllamaEmbeddingProvider
-from her.embeddings.service import build_embedding_provider
+from her.embeddings.service import EmbeddingService, build_embedding_provider
 
 
 def test_normalize_dimensions_pad_and_truncate() -> None:
@@ -15,7 +20,7 @@ def test_normalize_dimensions_pad_and_truncate() -> None:
 
 def test_build_embedding_provider_defaults_to_ollama() -> None:
     settings = Settings(embedding_provider="ollama")
-    provider = build_embedding_provider(settings)
+    provider = build_embedding_provider(settings, httpx.AsyncClient())
 
     assert isinstance(provider, OllamaEmbeddingProvider)
 
@@ -25,13 +30,38 @@ def test_build_embedding_provider_custom() -> None:
         embedding_provider="custom",
         custom_embedding_endpoint="https://example.com/embeddings",
     )
-    provider = build_embedding_provider(settings)
+    provider = build_embedding_provider(settings, httpx.AsyncClient())
 
     assert isinstance(provider, CustomEmbeddingProvider)
 
 
 def test_build_embedding_provider_none() -> None:
     settings = Settings(embedding_provider="none")
-    provider = build_embedding_provider(settings)
+    provider = build_embedding_provider(settings, httpx.AsyncClient())
 
     assert provider is None
+
+
+class CountingEmbeddingProvider(EmbeddingProvider):
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def embed(self, text: str) -> List[float]:
+        self.calls += 1
+        return [float(len(text))]
+
+
+@pytest.mark.asyncio
+async def test_embedding_service_caches_repeated_texts() -> None:
+    provider = CountingEmbeddingProvider()
+    service = EmbeddingService(provider, dimensions=1, cache_size=1)
+
+    assert await service.embed("hello") == [5.0]
+    assert await service.embed("hello") == [5.0]
+    assert provider.calls == 1
+
+    await service.embed("other")
+    await service.embed("hello")
+    assert provider.calls == 3
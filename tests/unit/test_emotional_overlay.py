@@ -37,3 +37,10 @@ def test_infer_emotional_state_detects_curiosity() -> None:
     inferred = infer_emotional_state("Why does this happen and how can I fix it?", current)
 
     assert inferred.state == "curious"
+
+
+def test_infer_emotional_state_detects_playfulness() -> None:
+    current = EmotionalState(state="calm", intensity=0.2, decay_rate=0.1)
+    inferred = infer_emotional_state("haha that was a fun one", current)
+
+    assert inferred.state == "playful"
@@ -1,5 +1,6 @@
 import pytest
 
+from her.guardrails.content_filter import contains_disallowed_content
 from her.guardrails.ethical_core import EthicalCore
 
 
@@ -12,3 +13,9 @@ def test_ethics_rejects_harmful_input() -> None:
 def test_ethics_accepts_safe_input() -> None:
     core = EthicalCore.default()
     core.validate_user_content("Help me organize my day")
+
+
+def test_content_filter_matches_custom_patterns_literally() -> None:
+    assert contains_disallowed_content("Price is $5 (approx.)", patterns=["$5 (approx"])
+    assert not contains_disallowed_content("Price is 5", patterns=["$5 (approx"])
+    assert not contains_disallowed_content("anything", patterns=[])
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from her.models import LLMRequest, LLMResponse
@@ -14,6 +16,24 @@ class FailingProvider(LLMProvider):
         raise ProviderServerError("failed")
 
 
+class SlowProvider(LLMProvider):
+    name = "slow"
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        await asyncio.sleep(1)
+        raise AssertionError("timeout should cancel the slow provider")
+
+
+class UnconfiguredProvider(LLMProvider):
+    name = "unconfigured"
+
+    def is_configured(self) -> bool:
+        return False
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        raise AssertionError("unconfigured providers should be skipped")
+
+
 class SuccessProvider(LLMProvider):
     name = "ok"
 
@@ -42,3 +62,31 @@ async def test_fallback_router_uses_next_provider() -> None:
     response = await router.generate(request)
     assert response.provider == "ok"
     assert response.content == "hello"
+
+
+@pytest.mark.asyncio
+async def test_fallback_router_times_out_slow_provider() -> None:
+    router = FallbackRouter([SlowProvider(), SuccessProvider()], timeout_seconds=0.01)
+    request = LLMRequest(
+        messages=[{"role": "user", "content": "hi"}],
+        system_prompt="sys",
+        session_id=uuid4(),
+        trace_id=str(uuid4()),
+    )
+
+    response = await router.generate(request)
+    assert response.provider == "ok"
+
+
+@pytest.mark.asyncio
+async def test_fallback_router_skips_unconfigured_providers() -> None:
+    router = FallbackRouter([UnconfiguredProvider(), SuccessProvider()], timeout_seconds=2)
+    request = LLMRequest(
+        messages=[{"role": "user", "content": "hi"}],
+        system_prompt="sys",
+        session_id=uuid4(),
+        trace_id=str(uuid4()),
+    )
+
+    response = await router.generate(request)
+    assert response.provider == "ok"
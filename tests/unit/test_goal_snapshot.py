@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+from her.memory.snapshots import ActiveGoalSnapshot
+from her.memory.types import GoalRecord
+
+
+@dataclass
+class CountingGoalSource:
+    calls: int = 0
+
+    async def list_active_goals(self, limit: int = 20) -> List[GoalRecord]:
+        self.calls += 1
+        return [
+            GoalRecord(
+                id=uuid4(),
+                description=f"goal {self.calls}",
+                status="active",
+                priority=0.5,
+                created_at=datetime.utcnow(),
+                last_progressed=None,
+            )
+        ][:limit]
+
+
+@pytest.mark.asyncio
+async def test_goal_snapshot_loads_lazily_and_serves_cached_reads() -> None:
+    source = CountingGoalSource()
+    snapshot = ActiveGoalSnapshot(source, limit=5)
+
+    first = await snapshot.get()
+    second = await snapshot.get()
+
+    assert source.calls == 1
+    assert first is second
+    assert first[0].description == second[0].description == "goal 1"
+
+    await snapshot.refresh()
+    refreshed = await snapshot.get()
+    assert refreshed[0].description == "goal 2"
+
+
+@pytest.mark.asyncio
+async def test_goal_snapshot_reloads_when_marked_stale() -> None:
+    source = CountingGoalSource()
+    snapshot = ActiveGoalSnapshot(source, limit=5, refresh_seconds=60.0)
+
+    await snapshot.get()
+    snapshot.mark_stale()
+    assert (await snapshot.get())[0].description == "goal 2"
+
+    snapshot.start()
+    try:
+        await asyncio.sleep(0.01)
+        assert source.calls == 3
+        snapshot.mark_stale()
+        await asyncio.sleep(0.01)
+        assert source.calls == 4
+    finally:
+        await snapshot.stop()
+
+
+@dataclass
+class FailingGoalSource:
+    calls: int = 0
+
+    async def list_active_goals(self, limit: int = 20) -> List[GoalRecord]:
+        self.calls += 1
+        await asyncio.sleep(0)
+        raise ConnectionError("database unavailable")
+
+
+@pytest.mark.asyncio
+async def test_goal_snapshot_backs_off_after_failed_load() -> None:
+    source = FailingGoalSource()
+    snapshot = ActiveGoalSnapshot(source, limit=5, failure_backoff_seconds=60.0)
+
+    results = await asyncio.gather(*(snapshot.get() for _ in range(10)))
+
+    assert results == [[]] * 10
+    assert source.calls == 1
+    assert await snapshot.get() == []
+    assert source.calls == 1
+
+    snapshot.mark_stale()
+    await snapshot.get()
+    assert source.calls == 2
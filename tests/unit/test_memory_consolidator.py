@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+from her.memory.consolidator import MemoryConsolidator
+from her.memory.types import SemanticMemoryRecord
+
+
+@dataclass
+class FakeSemanticStore:
+    records: List[SemanticMemoryRecord]
+    reinforced: List[SemanticMemoryRecord] = field(default_factory=list)
+
+    async def all_records(self) -> List[SemanticMemoryRecord]:
+        return self.records
+
+    async def reinforce_concepts(self, updates: List[SemanticMemoryRecord]) -> List[SemanticMemoryRecord]:
+        self.reinforced.extend(updates)
+        return updates
+
+
+@pytest.mark.asyncio
+async def test_consolidator_reinforces_duplicates_with_their_episodes_and_tags() -> None:
+    canonical = SemanticMemoryRecord(
+        id=uuid4(), concept="Tea", summary="likes tea", confidence=0.9, source_episode_ids=[uuid4()]
+    )
+    duplicate_episode = uuid4()
+    duplicate = SemanticMemoryRecord(
+        id=uuid4(),
+        concept="tea ",
+        summary="prefers green",
+        confidence=0.95,
+        source_episode_ids=[duplicate_episode],
+        tags=["drink"],
+    )
+    store = FakeSemanticStore(records=[canonical, duplicate])
+
+    updates = await MemoryConsolidator(store).consolidate()  # type: ignore[arg-type]
+
+    assert updates == 1
+    (update,) = store.reinforced
+    assert update.concept == "tea "
+    assert update.summary == "likes tea prefers green"
+    assert update.source_episode_ids == [duplicate_episode]
+    assert update.tags == ["drink"]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from her.agents.orchestrator import AgentOrchestrator, OrchestratorBusyError
+from her.models import LLMResponse
+
+
+class BlockingConversationAgent:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+
+    async def respond(self, session_id: UUID, content: str, trace_id: str) -> LLMResponse:
+        del session_id, trace_id
+        await self.release.wait()
+        return LLMResponse(
+            content=content,
+            provider="dummy",
+            model="dummy-model",
+            prompt_tokens=1,
+            completion_tokens=1,
+            cost_usd=0.0,
+            latency_ms=1,
+        )
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_rejects_interactions_over_inflight_limit() -> None:
+    agent = BlockingConversationAgent()
+    orchestrator = AgentOrchestrator(agent, max_inflight=1)  # type: ignore[arg-type]
+
+    first = asyncio.create_task(orchestrator.handle_interaction(uuid4(), "first", "trace-1"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(OrchestratorBusyError):
+        await orchestrator.handle_interaction(uuid4(), "second", "trace-2")
+
+    agent.release.set()
+    assert (await first).content == "first"
+    assert (await orchestrator.handle_interaction(uuid4(), "third", "trace-3")).content == "third"
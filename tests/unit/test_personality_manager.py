@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -65,6 +66,7 @@ async def test_personality_manager_builds_prompt_and_snapshots() -> None:
     )
 
     prompt = await manager.build_prompt_for_interaction("Why is this failing? I need help.")
+    await manager.flush()
 
     assert "Current emotion:" in prompt
     assert "Tone vector:" in prompt
@@ -85,12 +87,31 @@ async def test_personality_manager_weekly_regression_creates_snapshot() -> None:
 
     await manager.build_prompt_for_interaction("This is awesome, thanks!")
     updated = await manager.weekly_regression()
+    await manager.flush()
 
     assert isinstance(updated, PersonalityVector)
     assert len(snapshot_store.calls) == 2
     assert snapshot_store.calls[-1].trigger_summary == "weekly_regression"
 
 
+@pytest.mark.asyncio
+async def test_personality_manager_skips_snapshot_when_state_unchanged() -> None:
+    baseline = _baseline()
+    snapshot_store = FakeSnapshotStore()
+    manager = PersonalityManager(
+        baseline_personality=baseline,
+        baseline_emotion=EmotionalState(state="calm", intensity=0.0, decay_rate=0.1),
+        drift_engine=DriftEngine(baseline, config=DriftConfig()),
+        snapshot_store=snapshot_store,
+    )
+
+    await manager.weekly_regression()
+    await manager.weekly_regression()
+    await manager.flush()
+
+    assert len(snapshot_store.calls) == 1
+
+
 @pytest.mark.asyncio
 async def test_personality_manager_restore_from_snapshot() -> None:
     baseline = _baseline()
@@ -120,3 +141,46 @@ async def test_personality_manager_restore_from_snapshot() -> None:
 
     assert manager.current_personality.curiosity == 0.81
     assert manager.current_emotion.state == "reflective"
+
+
+@dataclass
+class SlowFirstSnapshotStore(FakeSnapshotStore):
+    started: int = 0
+
+    async def create_personality_snapshot(
+        self,
+        traits: Dict[str, float],
+        emotional_baseline: Dict[str, float | str | None],
+        drift_delta: Optional[Dict[str, float]] = None,
+        trigger_summary: Optional[str] = None,
+    ) -> None:
+        self.started += 1
+        if self.started == 1:
+            await asyncio.sleep(0.02)
+        await super().create_personality_snapshot(
+            traits, emotional_baseline, drift_delta, trigger_summary
+        )
+
+
+@pytest.mark.asyncio
+async def test_personality_manager_writes_snapshots_in_order() -> None:
+    baseline = _baseline()
+    snapshot_store = SlowFirstSnapshotStore()
+    manager = PersonalityManager(
+        baseline_personality=baseline,
+        baseline_emotion=EmotionalState(state="calm", intensity=0.2, decay_rate=0.1),
+        drift_engine=DriftEngine(baseline, config=DriftConfig()),
+        snapshot_store=snapshot_store,
+    )
+
+    await manager.build_prompt_for_interaction("Why is this failing? I need help.")
+    await manager.build_prompt_for_interaction("Prove it with evidence, please.")
+    await manager.weekly_regression()
+    await manager.flush()
+
+    assert [call.trigger_summary for call in snapshot_store.calls] == [
+        "interaction",
+        "interaction",
+        "weekly_regression",
+    ]
+    assert snapshot_store.calls[-1].traits != snapshot_store.calls[0].traits
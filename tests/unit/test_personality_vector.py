@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from her.personality import vector
+from her.personality.vector import load_drift_config, load_emotional_baseline, load_personality_baseline
+
+BASELINE_PATH = Path(__file__).resolve().parents[2] / "her" / "config" / "personality_baseline.yaml"
+
+
+def test_baseline_loaders_share_one_yaml_parse(monkeypatch) -> None:
+    vector._YAML_CACHE.clear()
+    parses = []
+    original_load = vector.yaml.load
+
+    def counting_load(stream, Loader):
+        parses.append(stream)
+        return original_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(vector.yaml, "load", counting_load)
+
+    personality = load_personality_baseline(BASELINE_PATH)
+    emotion = load_emotional_baseline(BASELINE_PATH)
+    drift = load_drift_config(BASELINE_PATH)
+
+    assert personality.warmth == 0.8
+    assert emotion.state == "calm"
+    assert drift.max_single_delta == 0.02
+    assert len(parses) == 1
+
+
+def test_yaml_cache_reloads_when_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "baseline.yaml"
+    config_path.write_text(BASELINE_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+    assert load_personality_baseline(config_path).warmth == 0.8
+
+    updated = config_path.read_text(encoding="utf-8").replace("warmth: 0.8", "warmth: 0.65")
+    config_path.write_text(updated, encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_personality_baseline(config_path).warmth == 0.65
+
+
+def test_empty_config_loads_as_empty_mapping(tmp_path: Path) -> None:
+    config_path = tmp_path / "empty.yaml"
+    config_path.write_bytes(b"")
+
+    assert load_drift_config(config_path).max_single_delta == 0.02
@@ -30,3 +30,70 @@ def test_goals_route() -> None:
         response = client.get("/goals")
         assert response.status_code == 200
         assert isinstance(response.json(), list)
+
+
+def test_health_route_reports_dependencies() -> None:
+    get_settings.cache_clear()
+    with TestClient(create_app()) as client:
+        response = client.get("/health")
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["status"] in {"ok", "degraded"}
+        assert {"database", "redis"} <= payload.keys()
+
+
+def test_openapi_schema_is_cached_with_etag() -> None:
+    get_settings.cache_clear()
+    with TestClient(create_app()) as client:
+        response = client.get("/openapi.json")
+        assert response.status_code == 200
+        assert "/chat" in response.json()["paths"]
+
+        etag = response.headers["etag"]
+        cached = client.get("/openapi.json", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+
+def test_metrics_route_serves_prometheus_payload() -> None:
+    get_settings.cache_clear()
+    with TestClient(create_app()) as client:
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+
+
+def test_request_id_header_is_echoed_or_generated() -> None:
+    get_settings.cache_clear()
+    with TestClient(create_app()) as client:
+        echoed = client.get("/state", headers={"X-Request-ID": "req-123"})
+        assert echoed.headers["x-request-id"] == "req-123"
+
+        generated = client.get("/state")
+        assert len(generated.headers["x-request-id"]) == 32
+
+
+def test_websocket_reports_invalid_payloads_without_closing() -> None:
+    get_settings.cache_clear()
+    with TestClient(create_app()) as client:
+        with client.websocket_connect("/ws") as websocket:
+            websocket.send_text("not json")
+            assert websocket.receive_json() == {"error": "payload must be a JSON object"}
+
+            websocket.send_json({"session_id": "nope", "content": "hi"})
+            assert websocket.receive_json() == {"error": "session_id must be a UUID"}
+
+            websocket.send_json({"session_id": "00000000-0000-0000-0000-000000000000", "content": " "})
+            assert websocket.receive_json() == {"error": "content is required"}
+
+
+def test_request_id_header_is_set_on_rejected_requests() -> None:
+    get_settings.cache_clear()
+    settings = get_settings()
+    with TestClient(create_app()) as client:
+        response = client.post(
+            "/chat",
+            content=b"x" * (settings.api_max_body_bytes + 1),
+            headers={"X-Request-ID": "req-413"},
+        )
+        assert response.status_code == 413
+        assert response.headers["x-request-id"] == "req-413"
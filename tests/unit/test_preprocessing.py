@@ -3,6 +3,7 @@ import pytest
 from her.agents.preprocessing import (
     classify_intent,
     detect_bias_signals,
+    detect_sentiment,
     preprocess_input,
     sanitize_text,
 )
@@ -12,11 +13,21 @@ def test_sanitize_text_removes_extra_whitespace() -> None:
     assert sanitize_text(" hello\n\nworld \t test ") == "hello world test"
 
 
+def test_sanitize_text_strips_control_characters() -> None:
+    assert sanitize_text("a \x00 b\u200bc\x7f") == "a bc"
+
+
 def test_classify_intent_question() -> None:
     intent = classify_intent("How does this work?", ["how", "does", "this", "work"])
     assert intent == "question"
 
 
+def test_detect_sentiment_balances_positive_and_negative_words() -> None:
+    assert detect_sentiment(["thanks", "but", "this", "is", "wrong"]) == "neutral"
+    assert detect_sentiment(["bad", "and", "wrong", "but", "thanks"]) == "negative"
+    assert detect_sentiment(["great", "good"]) == "positive"
+
+
 def test_detect_bias_signals() -> None:
     signals = detect_bias_signals("You said this before but now contradict and I want to avoid it")
     assert "value-contradiction" in signals
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from her.embeddings.ollama_provider import OllamaEmbeddingProvider
+from her.providers import http_client
+from her.providers.http_client import create_provider_http_client
+
+
+@pytest.mark.asyncio
+async def test_embedding_requests_reuse_injected_client() -> None:
+    seen_timeouts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen_timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={"embeddings": [[0.5, 0.5]]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        provider = OllamaEmbeddingProvider(
+            base_url="http://ollama.test",
+            model="embed",
+            dimensions=2,
+            timeout_seconds=3.0,
+            http_client=client,
+        )
+        await provider.embed("first")
+        await provider.embed("second")
+
+    assert seen_timeouts == [3.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_provider_http_client_uses_configured_pool_limits(monkeypatch) -> None:
+    captured = {}
+    real_client = httpx.AsyncClient
+
+    def build_client(**kwargs):
+        captured.update(kwargs)
+        return real_client(**kwargs)
+
+    monkeypatch.setattr(http_client.httpx, "AsyncClient", build_client)
+    client = create_provider_http_client(max_connections=10, max_keepalive_connections=8)
+    await client.aclose()
+
+    assert captured["limits"] == httpx.Limits(max_connections=10, max_keepalive_connections=8)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import weakref
+
+import pytest
+
+from her.tools import sandbox
+from her.tools.sandbox import run_sandboxed_command
+
+
+@pytest.mark.asyncio
+async def test_sandboxed_command_reuses_resolved_executable() -> None:
+    sandbox._resolve_executable.cache_clear()
+
+    first = await run_sandboxed_command([sys.executable, "-c", "print('one')"])
+    second = await run_sandboxed_command([sys.executable, "-c", "print('two')"])
+
+    assert first.strip() == "one"
+    assert second.strip() == "two"
+    assert sandbox._resolve_executable.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_sandboxed_command_rejects_unknown_executable() -> None:
+    with pytest.raises(FileNotFoundError):
+        await run_sandboxed_command(["her-definitely-missing-binary"])
+
+
+@pytest.mark.asyncio
+async def test_sandboxed_command_times_out() -> None:
+    with pytest.raises(TimeoutError):
+        await run_sandboxed_command([sys.executable, "-c", "import time; time.sleep(5)"], timeout_seconds=0.1)
+
+
+@pytest.mark.asyncio
+async def test_sandboxed_command_merges_env_overrides(monkeypatch) -> None:
+    monkeypatch.setenv("HER_SANDBOX_INHERITED", "base")
+    script = "import os; print(os.environ['HER_SANDBOX_INHERITED'], os.environ.get('HER_SANDBOX_EXTRA'))"
+
+    inherited = await run_sandboxed_command([sys.executable, "-c", script])
+    merged = await run_sandboxed_command([sys.executable, "-c", script], env={"HER_SANDBOX_EXTRA": "x"})
+
+    assert inherited.split() == ["base", "None"]
+    assert merged.split() == ["base", "x"]
+
+
+@pytest.mark.asyncio
+async def test_sandboxed_command_pipes_script_on_stdin() -> None:
+    output = await run_sandboxed_command([sys.executable, "-"], stdin=b"print(6 * 7)\n")
+
+    assert output.strip() == "42"
+
+
+@pytest.mark.asyncio
+async def test_sandboxed_command_streams_payloads_larger_than_arg_max() -> None:
+    payload = "é" * (1024 * 1024)
+    script = "import sys; print(len(sys.stdin.buffer.read()))"
+
+    output = await run_sandboxed_command([sys.executable, "-c", script], stdin=payload)
+
+    assert output.strip() == str(2 * 1024 * 1024)
+
+
+@pytest.mark.asyncio
+async def test_sandboxed_command_runs_shell_script_from_stdin() -> None:
+    script = 'name="sandbox"\nprintf "hello %s\\n" "$name"\n'
+
+    output = await run_sandboxed_command(["sh", "-s"], stdin=script)
+
+    assert output == "hello sandbox\n"
+
+
+@pytest.mark.asyncio
+async def test_sandboxed_commands_respect_parallel_limit(monkeypatch) -> None:
+    monkeypatch.setattr(sandbox, "MAX_PARALLEL_COMMANDS", 1)
+    monkeypatch.setattr(sandbox, "_command_slots", weakref.WeakKeyDictionary())
+    script = "import time; print(time.monotonic()); time.sleep(0.1); print(time.monotonic())"
+
+    outputs = await asyncio.gather(
+        *(run_sandboxed_command([sys.executable, "-c", script]) for _ in range(3))
+    )
+
+    spans = sorted(tuple(float(value) for value in output.split()) for output in outputs)
+    assert all(earlier[1] <= later[0] for earlier, later in zip(spans, spans[1:]))
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from her.agents.token_budget import TokenBudgetManager
+from her.agents.token_budget import TokenBudgetManager, estimate_tokens
 
 
 def test_token_budget_drops_old_messages_when_needed() -> None:
@@ -18,3 +18,72 @@ def test_token_budget_drops_old_messages_when_needed() -> None:
     assert window.dropped_messages > 0
     assert len(window.messages) < len(messages)
     assert manager.session_tokens(session_id) > 0
+
+
+def test_token_budget_drops_trailing_context_sections_over_budget() -> None:
+    manager = TokenBudgetManager(max_input_tokens=30)
+
+    window = manager.build_window(
+        session_id=uuid4(),
+        base_system_prompt="System prompt",
+        context_sections=["first section " * 5, "  ", "second section " * 10],
+        messages=[],
+    )
+
+    assert window.system_prompt == "System prompt\n\n" + ("first section " * 5).strip()
+
+
+def test_token_budget_keeps_a_contiguous_recent_window() -> None:
+    manager = TokenBudgetManager(max_input_tokens=120)
+    messages = [
+        {"role": "user", "content": "short old message"},
+        {"role": "assistant", "content": "long " * 200},
+        {"role": "user", "content": "latest question"},
+    ]
+
+    window = manager.build_window(
+        session_id=uuid4(),
+        base_system_prompt="System prompt",
+        context_sections=[],
+        messages=messages,
+    )
+
+    assert window.messages == [{"role": "user", "content": "latest question"}]
+    assert window.dropped_messages == 2
+
+
+def test_token_budget_counts_system_prompt_tokens_once_composed() -> None:
+    manager = TokenBudgetManager(max_input_tokens=30)
+    session_id = uuid4()
+
+    window = manager.build_window(
+        session_id=session_id,
+        base_system_prompt="System prompt",
+        context_sections=["first section " * 5, "second section " * 10],
+        messages=[],
+    )
+
+    assert manager.session_tokens(session_id) == estimate_tokens(window.system_prompt)
+
+
+def test_token_budget_truncates_an_oversized_latest_message() -> None:
+    manager = TokenBudgetManager(max_input_tokens=120)
+    messages = [
+        {"role": "assistant", "content": "earlier reply"},
+        {"role": "user", "content": "word " * 500},
+    ]
+
+    window = manager.build_window(
+        session_id=uuid4(),
+        base_system_prompt="System prompt",
+        context_sections=[],
+        messages=messages,
+    )
+
+    assert len(window.messages) == 1
+    latest = window.messages[0]
+    assert latest["role"] == "user"
+    assert latest["content"].startswith("word word")
+    assert estimate_tokens(latest["content"]) + 4 <= 120 - estimate_tokens("System prompt")
+    assert window.dropped_messages == 1
+    assert messages[-1]["content"] == "word " * 500
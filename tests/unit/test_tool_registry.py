@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from her.tools.registry import Tool, ToolRegistry
+
+
+async def _echo(text: str = "") -> str:
+    return text
+
+
+def test_list_tools_is_reused_until_registry_changes() -> None:
+    registry = ToolRegistry()
+    registry.register(
+        Tool(name="echo", handler=_echo, requires_approval=False, description="Echo text.")
+    )
+
+    first = registry.list_tools()
+    assert registry.list_tools() is first
+    assert first == ({"name": "echo", "description": "Echo text.", "requires_approval": False},)
+
+    registry.register(Tool(name="shout", handler=_echo, requires_approval=True))
+    assert [descriptor["name"] for descriptor in registry.list_tools()] == ["echo", "shout"]
+
+
+@pytest.mark.asyncio
+async def test_invoke_calls_registered_handler() -> None:
+    registry = ToolRegistry()
+    registry.register(Tool(name="echo", handler=_echo, requires_approval=False))
+
+    assert await registry.invoke("echo", text="hi") == "hi"
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from her.tools import web_research
+from her.tools.web_research import create_web_research_client, fetch_url_text
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_text_encodes_params_and_headers() -> None:
+    seen = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen["query"] = dict(request.url.params)
+        seen["agent"] = request.headers["user-agent"]
+        return httpx.Response(200, text="ok")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await fetch_url_text(
+            client,
+            "https://example.test/search",
+            params={"q": 'a&b="$HOME"'},
+            headers={"User-Agent": 'her "research"'},
+        )
+
+    assert seen == {"query": {"q": 'a&b="$HOME"'}, "agent": 'her "research"'}
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_text_does_not_follow_redirects(monkeypatch) -> None:
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(302, headers={"Location": "http://169.254.169.254/latest"})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        web_research.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    async with create_web_research_client() as client:
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            await fetch_url_text(client, "https://example.test/old")
+
+    assert requested == ["/old"]
+    assert excinfo.value.response.headers["location"] == "http://169.254.169.254/latest"
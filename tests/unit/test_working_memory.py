@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+from typing import Dict, List
 from uuid import uuid4
 
 import pytest
 
+from her.memory import working
 from her.memory.working import WorkingMemory
 
 
@@ -17,3 +20,196 @@ async def test_working_memory_falls_back_when_redis_unavailable() -> None:
 
     assert messages == [{"role": "user", "content": "hello"}]
     await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_working_memory_append_and_get_returns_history() -> None:
+    memory = WorkingMemory(redis_url="redis://127.0.0.1:1/0", ttl_minutes=1)
+    session_id = uuid4()
+
+    await memory.append(session_id=session_id, role="assistant", content="hi")
+    messages = await memory.append_and_get(session_id=session_id, role="user", content="hello")
+
+    assert messages == [
+        {"role": "assistant", "content": "hi"},
+        {"role": "user", "content": "hello"},
+    ]
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_working_memory_fallback_expires_sessions(monkeypatch: pytest.MonkeyPatch) -> None:
+    memory = WorkingMemory(redis_url="redis://127.0.0.1:1/0", ttl_minutes=1)
+    session_id = uuid4()
+    clock = [1000.0]
+    monkeypatch.setattr(working.time, "monotonic", lambda: clock[0])
+
+    await memory.append(session_id=session_id, role="user", content="hello")
+    clock[0] += 61
+    messages = await memory.get(session_id=session_id)
+
+    assert messages == []
+    await memory.close()
+
+
+def test_working_memory_message_fields_stay_unique_within_a_clock_tick(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(working.time, "time_ns", lambda: 1_000)
+
+    fields = [working._message_field() for _ in range(3)]
+
+    assert len(set(fields)) == 3
+    assert sorted(fields, key=int) == fields
+
+
+class RecordingPipeline:
+    def __init__(self, batches: List[List[Dict[str, str]]]) -> None:
+        self._batches = batches
+        self._pending: List[Dict[str, str]] = []
+
+    async def __aenter__(self) -> "RecordingPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def xadd(self, name: str, fields: Dict[str, str], maxlen: int, approximate: bool) -> None:
+        self._pending.append(fields)
+
+    async def execute(self) -> List[str]:
+        self._batches.append(self._pending)
+        return ["id"] * len(self._pending)
+
+
+class RecordingRedis:
+    def __init__(self) -> None:
+        self.batches: List[List[Dict[str, str]]] = []
+
+    def pipeline(self, transaction: bool = True) -> RecordingPipeline:
+        return RecordingPipeline(self.batches)
+
+    async def aclose(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_working_memory_batches_events_in_background() -> None:
+    memory = WorkingMemory(redis_url="redis://127.0.0.1:1/0", ttl_minutes=1)
+    client = RecordingRedis()
+    memory._client = client  # type: ignore[assignment]
+
+    for index in range(3):
+        await memory.emit_event("interaction.received", {"index": str(index)})
+    assert client.batches == []
+
+    await memory.flush_events()
+
+    assert client.batches == [
+        [{"event": "interaction.received", "index": str(index)} for index in range(3)]
+    ]
+    await memory.close()
+
+
+class HangingPipeline(RecordingPipeline):
+    async def execute(self) -> List[str]:
+        await asyncio.Event().wait()
+        return []
+
+
+class HangingRedis(RecordingRedis):
+    def pipeline(self, transaction: bool = True) -> RecordingPipeline:
+        return HangingPipeline(self.batches)
+
+
+@pytest.mark.asyncio
+async def test_working_memory_close_bounds_event_flush(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(working, "EVENT_FLUSH_TIMEOUT_SECONDS", 0.05)
+    memory = WorkingMemory(redis_url="redis://127.0.0.1:1/0", ttl_minutes=1)
+    memory._client = HangingRedis()  # type: ignore[assignment]
+
+    await memory.emit_event("interaction.received", {"index": "0"})
+    await asyncio.wait_for(memory.close(), timeout=1.0)
+
+    assert memory._event_writer is None
+
+
+@pytest.mark.asyncio
+async def test_working_memory_skips_events_when_disabled() -> None:
+    memory = WorkingMemory(redis_url="redis://127.0.0.1:1/0", ttl_minutes=1, events_enabled=False)
+    client = RecordingRedis()
+    memory._client = client  # type: ignore[assignment]
+
+    await memory.emit_event("interaction.received", {"index": "0"})
+    await memory.flush_events()
+
+    assert client.batches == []
+    assert memory._event_writer is None
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_working_memory_samples_events_into_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    draws = iter([0.1, 0.9, 0.4, 0.6])
+    monkeypatch.setattr("her.memory.working.random.random", lambda: next(draws))
+    memory = WorkingMemory(redis_url="redis://127.0.0.1:1/0", ttl_minutes=1, event_sample_rate=0.5)
+    client = RecordingRedis()
+    memory._client = client  # type: ignore[assignment]
+
+    for index in range(4):
+        await memory.emit_event("interaction.received", {"index": str(index)})
+    await memory.flush_events()
+
+    assert client.batches == [
+        [{"event": "interaction.received", "index": index} for index in ("0", "2")]
+    ]
+    await memory.close()
+
+
+class SlowPingRedis:
+    async def ping(self) -> bool:
+        await asyncio.sleep(0.01)
+        return True
+
+    async def aclose(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_working_memory_concurrent_callers_share_one_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created: List[SlowPingRedis] = []
+
+    def from_url(url: str, **kwargs: object) -> SlowPingRedis:
+        created.append(SlowPingRedis())
+        return created[-1]
+
+    monkeypatch.setattr(working.Redis, "from_url", from_url)
+    memory = WorkingMemory(redis_url="redis://127.0.0.1:1/0", ttl_minutes=1)
+
+    clients = await asyncio.gather(*(memory._get_client() for _ in range(5)))
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_working_memory_never_connects_when_redis_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def from_url(url: str, **kwargs: object) -> SlowPingRedis:
+        raise AssertionError("Redis must not be contacted when disabled")
+
+    monkeypatch.setattr(working.Redis, "from_url", from_url)
+    memory = WorkingMemory(redis_url="redis://127.0.0.1:1/0", ttl_minutes=1, redis_enabled=False)
+    session_id = uuid4()
+
+    history = await memory.append_and_get(session_id=session_id, role="user", content="hello")
+    await memory.emit_event("interaction.received", {"index": "0"})
+
+    assert history == [{"role": "user", "content": "hello"}]
+    assert await memory.healthcheck() is False
+    assert memory._event_writer is None
+    await memory.close()